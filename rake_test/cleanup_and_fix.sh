@@ -135,6 +135,8 @@ mv test_*.py test_*.sh archive/test_scripts/ 2>/dev/null || true
 echo "Archiving old GUI theme experiments..."
 mv gui_cyberpunk_theme.py gui_dark_theme.py gui_light_theme.py gui_nature_theme.py \
    gui_direct_framebuffer.py gui_forest_rings_final.py archive/old_gui_themes/ 2>/dev/null || true
+# The archived themes import gui_helpers - copy it, display_forest_rings.py still needs the original
+cp gui_helpers.py archive/old_gui_themes/ 2>/dev/null || true
 
 # Move fix scripts
 echo "Archiving fix scripts..."
@@ -5,11 +5,13 @@ Replaces the original display.py with beautiful tree ring visualization
 """
 
 import pygame
+import numpy as np
 import math
 import random
 import os
+import sys
 import time
-from collections import deque
+from gui_helpers import HistoryBuffer, TextCache
 
 # Try to import touch handler for dummy driver
 try:
@@ -18,6 +20,13 @@ try:
 except ImportError:
     TOUCH_HANDLER_AVAILABLE = False
 
+# Numba is optional - ring geometry falls back to vectorized NumPy without it
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 # Global variables for display state
 _screen = None
 _gui = None
@@ -52,6 +61,36 @@ COLORS = {
     'reading_border': hex_to_rgb('#FFB400'), # Saffron border
 }
 
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def ring_geometry(values, min_val, max_val, max_radius):
+        """Compute ring radii and age-based alphas (compiled with Numba)"""
+        ring_count = values.shape[0]
+        radii = np.empty(ring_count, dtype=np.int32)
+        alphas = np.empty(ring_count, dtype=np.int32)
+        for i in range(ring_count):
+            normalized = (values[i] - min_val) / (max_val - min_val)
+            radii[i] = int(10 + normalized * max_radius)
+            alphas[i] = int(60 + i / ring_count * 140)
+        return radii, alphas
+else:
+    def ring_geometry(values, min_val, max_val, max_radius):
+        """Compute ring radii and age-based alphas (vectorized NumPy)"""
+        ring_count = len(values)
+        normalized = (values - min_val) / (max_val - min_val)
+        radii = (10 + normalized * max_radius).astype(np.int32)
+        alphas = (60 + np.arange(ring_count) / ring_count * 140).astype(np.int32)
+        return radii, alphas
+
+# Sensor fields that affect what is drawn on screen
+DISPLAYED_KEYS = ('temperature', 'humidity', 'pressure', 'gas', 'latitude', 'longitude', 'altitude')
+
+# Frames between history updates (3 seconds at main.py's 10 Hz render rate)
+HISTORY_UPDATE_FRAMES = 30
+
+# Maximum number of ring surfaces kept in the cache (rings of all four panels fit)
+RING_CACHE_SIZE = 512
+
 class ForestRingsDisplay:
     def __init__(self):
         # Set up display - Pi-optimized driver priority
@@ -74,37 +113,39 @@ class ForestRingsDisplay:
                 print("Falling back to auto-detection...")
                 os.environ.pop('SDL_VIDEODRIVER', None)
         
-        # If no pre-configured driver or it failed, try auto-detection
+        # If no pre-configured driver or it failed, pick the platform's driver directly
         if self.screen is None:
-            # Pi-first driver order (kmsdrm works best for DSI displays)
-            display_drivers = ['kmsdrm', 'fbcon', 'directfb', 'x11', 'cocoa', 'dummy']
+            if sys.platform == 'darwin':
+                driver = 'cocoa'
+            elif os.environ.get('DISPLAY'):
+                driver = 'x11'
+            elif sys.platform.startswith('linux'):
+                # No desktop session - kmsdrm works best for Pi DSI displays
+                driver = 'kmsdrm'
+            else:
+                driver = None
             
-            print("Forest Rings Display: Trying display drivers for Pi...")
-            for driver in display_drivers:
+            if driver:
+                print(f"Forest Rings Display: Using {driver} driver")
+                os.environ['SDL_VIDEODRIVER'] = driver
+                
+                # Disable mouse for Pi drivers
+                if driver == 'kmsdrm':
+                    os.environ['SDL_NOMOUSE'] = '1'
+                else:
+                    os.environ.pop('SDL_NOMOUSE', None)
+                
                 try:
-                    print(f"Testing {driver}...")
-                    os.environ['SDL_VIDEODRIVER'] = driver
-                    
-                    # Disable mouse for Pi drivers
-                    if driver in ['kmsdrm', 'fbcon', 'directfb']:
-                        os.environ['SDL_NOMOUSE'] = '1'
-                    else:
-                        os.environ.pop('SDL_NOMOUSE', None)
-                    
                     pygame.display.quit()
                     pygame.display.init()
                     self.screen = pygame.display.set_mode((self.WIDTH, self.HEIGHT))
-                    
                     actual_driver = pygame.display.get_driver()
                     print(f"SUCCESS: Using display driver: {actual_driver}")
-                    break
-                    
                 except pygame.error as e:
                     print(f"Failed {driver}: {e}")
-                    continue
         
         if self.screen is None:
-            print("All drivers failed - using pygame default")
+            print("Driver selection failed - using pygame default")
             os.environ.pop('SDL_VIDEODRIVER', None)
             os.environ.pop('SDL_NOMOUSE', None)
             pygame.display.init()
@@ -118,11 +159,26 @@ class ForestRingsDisplay:
         self.font_medium = pygame.font.Font(None, 24)
         self.font_small = pygame.font.Font(None, 20)
         
+        # Background gradient never changes - build it once
+        self.background = self.build_background()
+        
+        # Static text never changes - render it once
+        self.title_surface = self.font_title.render("Soil Monitor", True, COLORS['accent1']).convert_alpha()
+        self.title_rect = self.title_surface.get_rect(center=(self.WIDTH // 2, 30))
+        self.status_surface = self.font_medium.render("MONITORING", True, COLORS['accent1']).convert_alpha()
+        self.gps_header_surface = self.font_large.render("LOCATION", True, COLORS['gps']).convert_alpha()
+        self.rings_title_surface = self.font_large.render("Environmental Data Tree Rings", True, COLORS['text']).convert_alpha()
+        self.rings_title_rect = self.rings_title_surface.get_rect(center=(self.WIDTH // 2, 160))
+        self.inst1_surface = self.font_small.render("Tree rings grow as sensor data changes over time", True, COLORS['text_dim']).convert_alpha()
+        self.inst1_rect = self.inst1_surface.get_rect(center=(self.WIDTH // 2, 420))
+        self.inst2_surface = self.font_small.render("Continuously logging at 1 Hz until powered off", True, COLORS['text_dim']).convert_alpha()
+        self.inst2_rect = self.inst2_surface.get_rect(center=(self.WIDTH // 2, 445))
+        
         # Data history for tree rings (last 50 readings)
-        self.temp_history = deque(maxlen=50)
-        self.humidity_history = deque(maxlen=50)
-        self.pressure_history = deque(maxlen=50)
-        self.gas_history = deque(maxlen=50)
+        self.temp_history = HistoryBuffer(50)
+        self.humidity_history = HistoryBuffer(50)
+        self.pressure_history = HistoryBuffer(50)
+        self.gas_history = HistoryBuffer(50)
         
         # Initialize with some base values so rings show immediately
         self.temp_history.append(22.0)
@@ -130,64 +186,128 @@ class ForestRingsDisplay:
         self.pressure_history.append(1013.0)
         self.gas_history.append(50000.0)  # Typical VOC resistance in Ohms
         
-        self.time = 0
+        # Pre-rendered ring surfaces keyed by (radius, alpha, thickness, color)
+        self._ring_cache = {}
+        
+        # Rendered text surfaces keyed by (font, text, color), FIFO-bounded
+        self._text_cache = TextCache()
+        
+        # Rendered GPS coordinate lines for the last seen position
+        self._gps_cache_key = None
+        self._gps_surfs = None
+        
+        # What is currently on screen, used to find regions that need presenting
+        self._full_redraw = True
+        self._shown_values = {}
+        self._shown_gps = None
+        self._shown_state = None
+        
+        self._frame = 0  # Frames rendered, drives the history update cadence
         self.recording = True  # Always recording in continuous mode
         
         # Clock for frame rate
         self.clock = pygame.time.Clock()
     
+    def build_background(self):
+        """Build the full-screen background gradient surface"""
+        # One pixel per row - integer accumulators, no per-row float math
+        column = pygame.Surface((1, self.HEIGHT))
+        bg_r, bg_g, bg_b = COLORS['bg']
+        step_r = COLORS['bg_light'][0] - bg_r
+        step_g = COLORS['bg_light'][1] - bg_g
+        step_b = COLORS['bg_light'][2] - bg_b
+        acc_r = acc_g = acc_b = 0
+        for y in range(self.HEIGHT):
+            column.set_at((0, y), (bg_r + acc_r // self.HEIGHT, bg_g + acc_g // self.HEIGHT, bg_b + acc_b // self.HEIGHT))
+            acc_r += step_r
+            acc_g += step_g
+            acc_b += step_b
+        
+        # Stretch the column across the screen
+        return pygame.transform.scale(column, (self.WIDTH, self.HEIGHT)).convert()
+    
+    def get_ring_surface(self, ring_radius, alpha, thickness, ring_color):
+        """Return a cached ring surface, rendering it on first use"""
+        key = (ring_radius, alpha, thickness, ring_color)
+        ring_surface = self._ring_cache.get(key)
+        if ring_surface is None:
+            if len(self._ring_cache) >= RING_CACHE_SIZE:
+                # Evict the oldest entry
+                del self._ring_cache[next(iter(self._ring_cache))]
+            ring_surface = pygame.Surface((ring_radius * 2 + 4, ring_radius * 2 + 4), pygame.SRCALPHA)
+            pygame.draw.circle(ring_surface, (*ring_color[:3], alpha),
+                             (ring_radius + 2, ring_radius + 2), ring_radius, thickness)
+            ring_surface = ring_surface.convert_alpha()
+            self._ring_cache[key] = ring_surface
+        return ring_surface
+    
+    def ring_panel_rect(self, center_x, center_y, max_radius=70):
+        """Screen area covered by a ring cluster and its reading box"""
+        ring_extent = max_radius + 12
+        return pygame.Rect(center_x - ring_extent, center_y - ring_extent,
+                           ring_extent * 2, ring_extent + max_radius + 70)
+    
+    def reading_rect(self, center_x, center_y, max_radius=70):
+        """Screen area of the current reading box below a ring cluster"""
+        reading_width, reading_height = 100, 45
+        return pygame.Rect(center_x - reading_width // 2, center_y + max_radius + 25,
+                           reading_width, reading_height)
+    
     def draw_tree_rings(self, surface, center_x, center_y, data_history, ring_color, current_value, unit, label, max_radius=70):
         """Draw tree rings with separate current reading display"""
         if len(data_history) < 1:
             return
         
         # Normalize data to ring sizes
-        data_list = list(data_history)
-        min_val = min(data_list)
-        max_val = max(data_list)
+        data_values = data_history.values()
+        min_val = float(data_values.min())
+        max_val = float(data_values.max())
         
         if max_val == min_val:
             # Single value - draw a simple ring
             ring_radius = 25
             pygame.draw.circle(surface, ring_color, (center_x, center_y), ring_radius, 2)
         else:
+            # Ring sizes and opacities for all rings at once (newer = more opaque)
+            ring_count = len(data_values)
+            radii, alphas = ring_geometry(data_values, min_val, max_val, max_radius)
+            radii = radii.tolist()
+            alphas = alphas.tolist()
+            
             # Draw rings from oldest to newest (inside out)
-            for i, value in enumerate(data_list):
-                normalized = (value - min_val) / (max_val - min_val)
-                ring_radius = int(10 + normalized * max_radius)
-                
-                # Ring opacity based on age (newer = more opaque)
-                age_factor = i / len(data_list)
-                alpha = int(60 + age_factor * 140)
+            clip = surface.get_clip()
+            blit_list = []
+            for i, (ring_radius, alpha) in enumerate(zip(radii, alphas)):
+                # Skip rings that fall entirely outside the visible area
+                ring_rect = pygame.Rect(center_x - ring_radius - 2, center_y - ring_radius - 2,
+                                        ring_radius * 2 + 4, ring_radius * 2 + 4)
+                if not clip.colliderect(ring_rect):
+                    continue
                 
-                # Create ring surface with alpha
-                ring_surface = pygame.Surface((ring_radius * 2 + 4, ring_radius * 2 + 4), pygame.SRCALPHA)
-                ring_color_alpha = (*ring_color[:3], alpha)
-                thickness = 1 if i < len(data_list) - 3 else 2  # Thicker for recent rings
-                pygame.draw.circle(ring_surface, ring_color_alpha, 
-                                 (ring_radius + 2, ring_radius + 2), ring_radius, thickness)
+                thickness = 1 if i < ring_count - 3 else 2  # Thicker for recent rings
                 
-                # Blit ring
-                surface.blit(ring_surface, (center_x - ring_radius - 2, center_y - ring_radius - 2))
+                ring_surface = self.get_ring_surface(ring_radius, alpha, thickness, ring_color)
+                blit_list.append((ring_surface, ring_rect.topleft))
+            
+            # Blit all rings in one call
+            surface.blits(blit_list, doreturn=False)
         
         # Draw current reading in a separate box below
-        reading_width, reading_height = 100, 45
-        reading_x = center_x - reading_width // 2
-        reading_y = center_y + max_radius + 25
+        reading_rect = self.reading_rect(center_x, center_y, max_radius)
+        reading_y = reading_rect.y
         
         # Reading background
-        reading_rect = pygame.Rect(reading_x, reading_y, reading_width, reading_height)
         pygame.draw.rect(surface, COLORS['reading_bg'], reading_rect, border_radius=8)
         pygame.draw.rect(surface, COLORS['reading_border'], reading_rect, 2, border_radius=8)
         
         # Label
-        label_surface = self.font_small.render(label, True, COLORS['text_dim'])
+        label_surface = self._text_cache.render(self.font_small, label, COLORS['text_dim'])
         label_rect = label_surface.get_rect(center=(center_x, reading_y + 12))
         surface.blit(label_surface, label_rect)
         
         # Current value (large and clear)
         value_text = f"{current_value:.1f}{unit}"
-        value_surface = self.font_medium.render(value_text, True, COLORS['text'])
+        value_surface = self._text_cache.render(self.font_medium, value_text, COLORS['text'])
         value_rect = value_surface.get_rect(center=(center_x, reading_y + 28))
         surface.blit(value_surface, value_rect)
     
@@ -203,69 +323,72 @@ class ForestRingsDisplay:
     
     def render_frame(self, sensor_data, history_data):
         """Render the complete forest rings interface"""
-        self.time += 0.05
+        # Regions whose pixels changed this frame
+        dirty_rects = []
         
         # Always update data (continuous monitoring)
+        data_updated = False
         if sensor_data:
             # Only update occasionally to see ring growth
-            if int(self.time * 10) % 30 == 0:  # Every 3 seconds
+            if self._frame % HISTORY_UPDATE_FRAMES == 0:  # Every 3 seconds
                 self.update_data(sensor_data)
+                data_updated = True
+        self._frame += 1
+        
+        # Nothing on screen would change - keep the last presented frame
+        frame_state = tuple(sensor_data.get(key) for key in DISPLAYED_KEYS) if sensor_data else None
+        if not data_updated and not self._full_redraw and frame_state == self._shown_state:
+            self.clock.tick(30)
+            return None
+        self._shown_state = frame_state
         
         # Background gradient
-        for y in range(self.HEIGHT):
-            ratio = y / self.HEIGHT
-            bg_color = (
-                int(COLORS['bg'][0] + (COLORS['bg_light'][0] - COLORS['bg'][0]) * ratio),
-                int(COLORS['bg'][1] + (COLORS['bg_light'][1] - COLORS['bg'][1]) * ratio),
-                int(COLORS['bg'][2] + (COLORS['bg_light'][2] - COLORS['bg'][2]) * ratio)
-            )
-            pygame.draw.line(self.screen, bg_color, (0, y), (self.WIDTH, y))
+        self.screen.blit(self.background, (0, 0))
         
         # Title
-        title = self.font_title.render("Soil Monitor", True, COLORS['accent1'])
-        title_rect = title.get_rect(center=(self.WIDTH // 2, 30))
-        self.screen.blit(title, title_rect)
+        self.screen.blit(self.title_surface, self.title_rect)
         
         # Status - Always monitoring
-        status = "MONITORING"
-        status_color = COLORS['accent1']
-        status_surface = self.font_medium.render(status, True, status_color)
-        self.screen.blit(status_surface, (self.WIDTH - 130, 10))
+        self.screen.blit(self.status_surface, (self.WIDTH - 130, 10))
         
         # GPS Display (prominent and clean)
         gps_data = sensor_data
+        gps_y = 70
+        gps_rect = pygame.Rect(40, gps_y - 5, 420, 80)
+        gps_state = None
         if gps_data and gps_data.get('latitude') and gps_data.get('longitude'):
-            gps_y = 70
-            
             # GPS container
-            gps_rect = pygame.Rect(40, gps_y - 5, 420, 80)
             pygame.draw.rect(self.screen, COLORS['card'], gps_rect, border_radius=10)
             pygame.draw.rect(self.screen, COLORS['gps'], gps_rect, 2, border_radius=10)
             
             # GPS Header
-            gps_header = self.font_large.render("LOCATION", True, COLORS['gps'])
-            self.screen.blit(gps_header, (50, gps_y + 5))
-            
-            # Coordinates (large and clear)
-            lat_text = f"Lat: {gps_data['latitude']:.7f}°"
-            lon_text = f"Lon: {gps_data['longitude']:.7f}°"
-            alt_text = f"Alt: {gps_data.get('altitude', 0):.1f}m"
+            self.screen.blit(self.gps_header_surface, (50, gps_y + 5))
             
-            lat_surface = self.font_medium.render(lat_text, True, COLORS['text'])
-            lon_surface = self.font_medium.render(lon_text, True, COLORS['text'])
-            alt_surface = self.font_small.render(alt_text, True, COLORS['accent3'])
+            # Coordinates (large and clear) - only re-rendered when the position moves
+            gps_state = (round(gps_data['latitude'], 7), round(gps_data['longitude'], 7),
+                         round(gps_data.get('altitude', 0), 1))
+            if gps_state != self._gps_cache_key:
+                self._gps_surfs = (
+                    self.font_medium.render(f"Lat: {gps_data['latitude']:.7f}°", True, COLORS['text']).convert_alpha(),
+                    self.font_medium.render(f"Lon: {gps_data['longitude']:.7f}°", True, COLORS['text']).convert_alpha(),
+                    self.font_small.render(f"Alt: {gps_data.get('altitude', 0):.1f}m", True, COLORS['accent3']).convert_alpha(),
+                )
+                self._gps_cache_key = gps_state
+            lat_surface, lon_surface, alt_surface = self._gps_surfs
             
             self.screen.blit(lat_surface, (50, gps_y + 25))
             self.screen.blit(lon_surface, (50, gps_y + 45))
             self.screen.blit(alt_surface, (350, gps_y + 35))
         
+        if gps_state != self._shown_gps:
+            dirty_rects.append(gps_rect)
+            self._shown_gps = gps_state
+        
         # Tree Rings section
         rings_y = 180
         
         # Section title
-        rings_title = self.font_large.render("Environmental Data Tree Rings", True, COLORS['text'])
-        rings_title_rect = rings_title.get_rect(center=(self.WIDTH // 2, rings_y - 20))
-        self.screen.blit(rings_title, rings_title_rect)
+        self.screen.blit(self.rings_title_surface, self.rings_title_rect)
         
         # Get current sensor values for display
         current_temp = sensor_data.get('temperature', 22.0) if sensor_data else 22.0
@@ -276,29 +399,36 @@ class ForestRingsDisplay:
             current_gas = 50000.0
         
         # Draw tree rings in 2x2 grid layout
-        # Top row: Temperature and Humidity
-        self.draw_tree_rings(self.screen, 200, rings_y + 40, self.temp_history, COLORS['ring_temp'], 
-                           current_temp, "°C", "Temperature")
-        self.draw_tree_rings(self.screen, 600, rings_y + 40, self.humidity_history, COLORS['ring_hum'],
-                           current_hum, "%", "Humidity")
-        # Bottom row: Pressure and VOC (Gas)
-        self.draw_tree_rings(self.screen, 200, rings_y + 160, self.pressure_history, COLORS['ring_press'],
-                           current_press, " hPa", "Pressure")
-        self.draw_tree_rings(self.screen, 600, rings_y + 160, self.gas_history, COLORS['ring_gps'],
-                           current_gas/1000, " kΩ", "Air Quality")
+        ring_panels = [
+            # Top row: Temperature and Humidity
+            (200, rings_y + 40, self.temp_history, COLORS['ring_temp'], current_temp, "°C", "Temperature"),
+            (600, rings_y + 40, self.humidity_history, COLORS['ring_hum'], current_hum, "%", "Humidity"),
+            # Bottom row: Pressure and VOC (Gas)
+            (200, rings_y + 160, self.pressure_history, COLORS['ring_press'], current_press, " hPa", "Pressure"),
+            (600, rings_y + 160, self.gas_history, COLORS['ring_gps'], current_gas/1000, " kΩ", "Air Quality"),
+        ]
+        for center_x, center_y, data_history, ring_color, current_value, unit, label in ring_panels:
+            self.draw_tree_rings(self.screen, center_x, center_y, data_history, ring_color,
+                               current_value, unit, label)
+            
+            # Rings only change with the history; the reading box with its text
+            value_text = f"{current_value:.1f}{unit}"
+            if data_updated:
+                dirty_rects.append(self.ring_panel_rect(center_x, center_y))
+            elif self._shown_values.get(label) != value_text:
+                dirty_rects.append(self.reading_rect(center_x, center_y))
+            self._shown_values[label] = value_text
         
         # Instructions at bottom
-        inst1 = self.font_small.render("Tree rings grow as sensor data changes over time", True, COLORS['text_dim'])
-        inst2 = self.font_small.render("Continuously logging at 1 Hz until powered off", True, COLORS['text_dim'])
-        
-        inst1_rect = inst1.get_rect(center=(self.WIDTH // 2, 420))
-        inst2_rect = inst2.get_rect(center=(self.WIDTH // 2, 445))
-        
-        self.screen.blit(inst1, inst1_rect)
-        self.screen.blit(inst2, inst2_rect)
+        self.screen.blit(self.inst1_surface, self.inst1_rect)
+        self.screen.blit(self.inst2_surface, self.inst2_rect)
         
-        # Update display
-        pygame.display.flip()
+        # Update display - only the regions that changed
+        if self._full_redraw:
+            pygame.display.flip()
+            self._full_redraw = False
+        elif dirty_rects:
+            pygame.display.update(dirty_rects)
         self.clock.tick(30)
         
         return None  # No button anymore
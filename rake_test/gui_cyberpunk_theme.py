@@ -4,10 +4,12 @@ Cyberpunk Neon Theme GUI - Futuristic Style
 Dark background with bright neon accents and glowing effects
 """
 import os
+import datetime
+import time
 import pygame
-import math
+import numpy as np
 from typing import Dict, Any, List
-from collections import deque
+from gui_helpers import HistoryBuffer, TextCache, table_sin
 
 # Set up display - auto-detect best driver
 pygame.init()
@@ -57,6 +59,31 @@ COLORS = {
     'grid': (40, 40, 60),         # Dark grid
 }
 
+# Circular blit offsets for each glow radius used by draw_glow_text
+GLOW_OFFSETS = {
+    size: [(dx, dy) for dx in range(-size, size + 1) for dy in range(-size, size + 1)
+           if dx * dx + dy * dy <= size * size]
+    for size in range(1, 6)
+}
+
+# Screen regions that animate between data updates
+CLOCK_RECT = pygame.Rect(620, 10, 180, 65)
+GRAPH_RECT = pygame.Rect(25, 225, 510, 130)
+REC_RECT = pygame.Rect(540, 280, 130, 45)
+
+# Corner bracket vertices as ((corner x, corner y), offsets), where the corner
+# factors pick a rect corner (0 = left/top, 1 = right/bottom)
+CARD_CORNERS = (
+    ((0, 0), ((0, 15), (0, 0), (15, 0))),
+    ((1, 0), ((-15, 0), (0, 0), (0, 15))),
+)
+BUTTON_CORNERS = (
+    ((0, 0), ((-5, 12), (-5, -5), (12, -5))),
+    ((1, 0), ((-12, -5), (5, -5), (5, 12))),
+    ((0, 1), ((-5, -12), (-5, 5), (12, 5))),
+    ((1, 1), ((-12, 5), (5, 5), (5, -12))),
+)
+
 class CyberpunkGUI:
     def __init__(self):
         self.font_large = pygame.font.Font(None, 48)
@@ -65,33 +92,109 @@ class CyberpunkGUI:
         self.font_tiny = pygame.font.Font(None, 18)
         
         self.recording = False
-        self.history = deque(maxlen=120)
+        self.history = HistoryBuffer(120)
         self.time_offset = 0
         
-    def draw_glow_text(self, surface, text, font, color, x, y, glow_size=3):
-        """Draw text with neon glow effect"""
+        # Clock strings, reformatted once per second
+        self._clock_second = None
+        self._clock_text = ""
+        self._date_text = ""
+        
+        # Background never changes - build it once
+        self.bg_surface = self.build_background().convert()
+        
+        # Neon border sprites keyed by (color, size, thickness)
+        self._neon_cache = {}
+        
+        # Rendered text surfaces keyed by (font, text, color), FIFO-bounded
+        self._text_cache = TextCache()
+        
+        # Absolute corner bracket vertices keyed by (corners, rect)
+        self._corner_cache = {}
+        
+        # Hologram grid overlays keyed by rect size
+        self._hologram_grid_cache = {}
+        
+        # Reusable graph glow surfaces keyed by graph size
+        self._glow_surfaces = {}
+        
+        # Everything but the animated regions only changes with the data
+        self._static_key = None
+        self.dirty_rects = []
+        
+    def build_background(self):
+        """Build the background with its matrix-style lines"""
+        bg_surface = pygame.Surface((WIDTH, HEIGHT))
+        bg_surface.fill(COLORS['bg'])
+        # The screen has no per-pixel alpha, so the lines are drawn solid
+        for i in range(0, WIDTH, 40):
+            pygame.draw.line(bg_surface, COLORS['grid'], (i, 0), (i, HEIGHT))
+        return bg_surface
+    
+    def draw_glow_text(self, surface, text, font, color, x, y, glow_size=3, batch=None):
+        """Draw text with neon glow effect, or queue its blits onto batch"""
+        text_surf = self._text_cache.render(font, text, color)
+        text_width, text_height = text_surf.get_size()
+        
+        # Nothing to draw if the text and its glow fall entirely off screen
+        if (x + text_width + glow_size <= 0 or y + text_height + glow_size <= 0
+                or x - glow_size >= WIDTH or y - glow_size >= HEIGHT):
+            return text_width
+        
+        blit_list = [] if batch is None else batch
+        
         # Create glow layers
         for size in range(glow_size, 0, -1):
-            glow_surf = font.render(text, True, (*color[:3], 100 // size))
-            for dx in range(-size, size + 1):
-                for dy in range(-size, size + 1):
-                    if dx * dx + dy * dy <= size * size:
-                        surface.blit(glow_surf, (x + dx, y + dy), special_flags=pygame.BLEND_ADD)
+            glow_surf = self._text_cache.render(font, text, (*color[:3], 100 // size))
+            blit_list.extend((glow_surf, (x + dx, y + dy), None, pygame.BLEND_ADD)
+                             for dx, dy in GLOW_OFFSETS[size])
         
         # Main text
-        text_surf = font.render(text, True, color)
-        surface.blit(text_surf, (x, y))
-        return text_surf.get_width()
+        blit_list.append((text_surf, (x, y), None, 0))
+        
+        if batch is None:
+            surface.blits(blit_list, doreturn=False)
+        return text_width
+    
+    def get_neon_sprite(self, color, size, thickness):
+        """Return a cached neon border sprite, rendering it on first use"""
+        key = (color, size, thickness)
+        sprite = self._neon_cache.get(key)
+        if sprite is None:
+            width, height = size
+            sprite = pygame.Surface((width + 6, height + 6), pygame.SRCALPHA)
+            # The glow alpha was never visible on the opaque screen, so draw it solid
+            for i in range(3, 0, -1):
+                glow_rect = pygame.Rect(3 - i, 3 - i, width + 2*i, height + 2*i)
+                pygame.draw.rect(sprite, color[:3], glow_rect, thickness + i)
+            
+            # Main border
+            pygame.draw.rect(sprite, color[:3], pygame.Rect(3, 3, width, height), thickness)
+            sprite = sprite.convert_alpha()
+            self._neon_cache[key] = sprite
+        return sprite
     
     def draw_neon_rect(self, surface, color, rect, thickness=2):
         """Draw rectangle with neon glow effect"""
-        # Outer glow
-        for i in range(3, 0, -1):
-            glow_rect = pygame.Rect(rect.x - i, rect.y - i, rect.width + 2*i, rect.height + 2*i)
-            pygame.draw.rect(surface, (*color[:3], 50 // i), glow_rect, thickness + i)
-        
-        # Main border
-        pygame.draw.rect(surface, color, rect, thickness)
+        # The sprite reaches 3px past the rect on every side
+        if (rect.right + 3 <= 0 or rect.bottom + 3 <= 0
+                or rect.x - 3 >= WIDTH or rect.y - 3 >= HEIGHT):
+            return
+        surface.blit(self.get_neon_sprite(color, rect.size, thickness), (rect.x - 3, rect.y - 3))
+    
+    def draw_corner_brackets(self, surface, color, rect, corners):
+        """Draw corner brackets from a vertex template, caching the placed vertices"""
+        key = (corners, tuple(rect))
+        lines = self._corner_cache.get(key)
+        if lines is None:
+            x, y, width, height = rect
+            lines = [
+                [(x + fx * width + ox, y + fy * height + oy) for ox, oy in offsets]
+                for (fx, fy), offsets in corners
+            ]
+            self._corner_cache[key] = lines
+        for points in lines:
+            pygame.draw.lines(surface, color, False, points, 3)
     
     def draw_cyber_card(self, surface, x, y, width, height, title, value, unit, neon_color):
         """Draw a cyberpunk-style data card"""
@@ -104,13 +207,7 @@ class CyberpunkGUI:
         self.draw_neon_rect(surface, neon_color, card_rect, 2)
         
         # Corner decorations
-        corner_size = 15
-        pygame.draw.lines(surface, neon_color, False, [
-            (x, y + corner_size), (x, y), (x + corner_size, y)
-        ], 3)
-        pygame.draw.lines(surface, neon_color, False, [
-            (x + width - corner_size, y), (x + width, y), (x + width, y + corner_size)
-        ], 3)
+        self.draw_corner_brackets(surface, neon_color, card_rect, CARD_CORNERS)
         
         # Title with glow
         self.draw_glow_text(surface, title, self.font_small, COLORS['text_secondary'], x + 10, y + 8)
@@ -119,12 +216,26 @@ class CyberpunkGUI:
         self.draw_glow_text(surface, f"{value}", self.font_large, neon_color, x + 10, y + 35, 4)
         
         # Unit
-        unit_text = self.font_small.render(unit, True, COLORS['text_secondary'])
+        unit_text = self._text_cache.render(self.font_small, unit, COLORS['text_secondary'])
         surface.blit(unit_text, (x + 10, y + height - 25))
     
-    def draw_hologram_effect(self, surface, rect):
+    def get_hologram_grid(self, size):
+        """Return a cached hologram grid overlay, rendering it on first use"""
+        grid = self._hologram_grid_cache.get(size)
+        if grid is None:
+            width, height = size
+            # Lines run one pixel past the rect's right edge, as draw.line did
+            grid = pygame.Surface((width + 1, height), pygame.SRCALPHA)
+            # The screen has no per-pixel alpha, so the lines are drawn solid
+            for i in range(0, height, 20):
+                pygame.draw.line(grid, COLORS['grid'][:3], (0, i), (width, i))
+            grid = grid.convert_alpha()
+            self._hologram_grid_cache[size] = grid
+        return grid
+    
+    def draw_hologram_effect(self, surface, rect, ticks):
         """Draw scanning line effect"""
-        scan_y = int(rect.y + (rect.height * (0.5 + 0.4 * math.sin(pygame.time.get_ticks() * 0.005))))
+        scan_y = int(rect.y + (rect.height * (0.5 + 0.4 * table_sin(ticks * 0.005))))
         
         # Scanning line
         scan_color = (*COLORS['neon_cyan'][:3], 100)
@@ -133,12 +244,9 @@ class CyberpunkGUI:
         surface.blit(temp_surf, (rect.x, scan_y), special_flags=pygame.BLEND_ADD)
         
         # Grid overlay
-        for i in range(0, rect.height, 20):
-            alpha = 30
-            pygame.draw.line(surface, (*COLORS['grid'][:3], alpha), 
-                           (rect.x, rect.y + i), (rect.x + rect.width, rect.y + i))
+        surface.blit(self.get_hologram_grid(rect.size), rect.topleft)
     
-    def draw_cyber_graph(self, surface, x, y, width, height, data_points):
+    def draw_cyber_graph(self, surface, x, y, width, height, data_points, ticks):
         """Draw cyberpunk-style graph with effects"""
         if len(data_points) < 2:
             return
@@ -159,34 +267,42 @@ class CyberpunkGUI:
         
         # Data visualization
         if len(data_points) > 1:
-            points = []
-            min_val = min(data_points)
-            max_val = max(data_points)
+            values = np.asarray(data_points, dtype=np.float64)
+            point_count = len(values)
+            
+            min_val = values.min()
+            max_val = values.max()
             val_range = max_val - min_val if max_val > min_val else 1
             
-            for i, val in enumerate(data_points):
-                px = x + (i * width // len(data_points))
-                py = y + height - int(((val - min_val) / val_range) * height)
-                points.append((px, py))
+            # Project all readings at once
+            xs = x + np.arange(point_count) * width // point_count
+            ys = y + height - (((values - min_val) / val_range) * height).astype(np.int32)
+            points = list(zip(xs.tolist(), ys.tolist()))
+            # Same line in glow-surface coordinates, shared by every glow pass
+            glow_points = list(zip((xs - x + 5).tolist(), (ys - y + 5).tolist()))
             
-            # Glow effect for line
+            # Glow effect for line - additive blending ignores the layer alpha and the
+            # line colour saturates its channels in one pass, so all layers share a blit
+            glow_surf = self._glow_surfaces.get((width, height))
+            if glow_surf is None:
+                glow_surf = pygame.Surface((width + 10, height + 10), pygame.SRCALPHA).convert_alpha()
+                self._glow_surfaces[(width, height)] = glow_surf
+            glow_surf.fill((0, 0, 0, 0))
             for thickness in [8, 5, 3, 1]:
                 alpha = 50 if thickness == 8 else (100 if thickness == 5 else 255)
-                temp_surf = pygame.Surface((width + 10, height + 10), pygame.SRCALPHA)
-                if len(points) > 1:
-                    pygame.draw.lines(temp_surf, (*COLORS['graph_line'][:3], alpha), False, 
-                                    [(p[0] - x + 5, p[1] - y + 5) for p in points], thickness)
-                surface.blit(temp_surf, (x - 5, y - 5), special_flags=pygame.BLEND_ADD)
+                pygame.draw.lines(glow_surf, (*COLORS['graph_line'][:3], alpha), False, 
+                                glow_points, thickness)
+            surface.blit(glow_surf, (x - 5, y - 5), special_flags=pygame.BLEND_ADD)
             
             # Data points with pulse effect
-            pulse = 1.0 + 0.3 * math.sin(pygame.time.get_ticks() * 0.01)
+            pulse = 1.0 + 0.3 * table_sin(ticks * 0.01)
             for i, point in enumerate(points[-20::3]):  # Show subset of points
                 radius = int(4 * pulse)
                 pygame.draw.circle(surface, COLORS['neon_cyan'], point, radius)
                 pygame.draw.circle(surface, COLORS['text_primary'], point, 2)
         
         # Hologram scanning effect
-        self.draw_hologram_effect(surface, graph_rect)
+        self.draw_hologram_effect(surface, graph_rect, ticks)
     
     def draw_cyber_button(self, surface, x, y, width, height, text, active=False):
         """Draw cyberpunk-style button"""
@@ -201,27 +317,10 @@ class CyberpunkGUI:
         self.draw_neon_rect(surface, border_color, button_rect, 3)
         
         # Corner brackets
-        bracket_size = 12
-        bracket_color = border_color
-        
-        # Top corners
-        pygame.draw.lines(surface, bracket_color, False, [
-            (x - 5, y + bracket_size), (x - 5, y - 5), (x + bracket_size, y - 5)
-        ], 3)
-        pygame.draw.lines(surface, bracket_color, False, [
-            (x + width - bracket_size, y - 5), (x + width + 5, y - 5), (x + width + 5, y + bracket_size)
-        ], 3)
-        
-        # Bottom corners
-        pygame.draw.lines(surface, bracket_color, False, [
-            (x - 5, y + height - bracket_size), (x - 5, y + height + 5), (x + bracket_size, y + height + 5)
-        ], 3)
-        pygame.draw.lines(surface, bracket_color, False, [
-            (x + width - bracket_size, y + height + 5), (x + width + 5, y + height + 5), (x + width + 5, y + height - bracket_size)
-        ], 3)
+        self.draw_corner_brackets(surface, border_color, button_rect, BUTTON_CORNERS)
         
         # Button text with glow
-        text_surface = self.font_medium.render(text, True, border_color)
+        text_surface = self._text_cache.render(self.font_medium, text, border_color)
         text_rect = text_surface.get_rect()
         text_x = x + width // 2 - text_rect.width // 2
         text_y = y + height // 2 - text_rect.height // 2
@@ -231,43 +330,57 @@ class CyberpunkGUI:
     
     def render(self, sensor_data, gps_data, recording_status):
         """Render the complete cyberpunk GUI"""
-        # Animated background
-        SCREEN.fill(COLORS['bg'])
+        # Snapshot the readings once
+        readings = sensor_data or {}
+        temperature = readings.get('temperature')
+        latitude = readings.get('latitude')
+        longitude = readings.get('longitude')
+        altitude = readings.get('altitude')
+        gps_readings = gps_data or {}
+        has_gps = bool(gps_readings.get('latitude') and gps_readings.get('longitude'))
         
-        # Matrix-style background lines
-        for i in range(0, WIDTH, 40):
-            alpha = int(20 + 15 * math.sin(pygame.time.get_ticks() * 0.003 + i * 0.1))
-            pygame.draw.line(SCREEN, (*COLORS['grid'][:3], alpha), (i, 0), (i, HEIGHT))
+        # One animation clock for the whole frame
+        ticks = pygame.time.get_ticks()
         
-        # Header with glow
-        header_width = self.draw_glow_text(SCREEN, "ENVIRONMENTAL", self.font_large, COLORS['neon_cyan'], 30, 20, 4)
-        self.draw_glow_text(SCREEN, " MONITOR", self.font_large, COLORS['neon_pink'], 30 + header_width, 20, 4)
+        # Background with matrix-style lines
+        SCREEN.blit(self.bg_surface, (0, 0))
         
-        # Current time display (top right)
-        import datetime
-        current_time = datetime.datetime.now().strftime("%H:%M:%S")
-        current_date = datetime.datetime.now().strftime("%Y-%m-%d")
-        self.draw_glow_text(SCREEN, current_time, self.font_medium, COLORS['neon_cyan'], 630, 20, 3)
-        self.draw_glow_text(SCREEN, current_date, self.font_tiny, COLORS['text_secondary'], 640, 50)
+        # Header, clock and status text go out in one blit batch
+        text_blits = []
+        
+        # Header with glow
+        header_width = self.draw_glow_text(SCREEN, "ENVIRONMENTAL", self.font_large, COLORS['neon_cyan'], 30, 20, 4, text_blits)
+        self.draw_glow_text(SCREEN, " MONITOR", self.font_large, COLORS['neon_pink'], 30 + header_width, 20, 4, text_blits)
+        
+        # Current time display (top right) - only reformatted when the second ticks over
+        clock_second = int(time.time())
+        if clock_second != self._clock_second:
+            now = datetime.datetime.now()
+            self._clock_text = f"{now.hour:02d}:{now.minute:02d}:{now.second:02d}"
+            self._date_text = f"{now.year:04d}-{now.month:02d}-{now.day:02d}"
+            self._clock_second = clock_second
+        self.draw_glow_text(SCREEN, self._clock_text, self.font_medium, COLORS['neon_cyan'], 630, 20, 3, text_blits)
+        self.draw_glow_text(SCREEN, self._date_text, self.font_tiny, COLORS['text_secondary'], 640, 50, batch=text_blits)
         
         # System status
         status_y = 70
-        self.draw_glow_text(SCREEN, "BME680:", self.font_small, COLORS['text_secondary'], 30, status_y)
-        status_color = COLORS['neon_green'] if sensor_data and sensor_data.get('temperature') else COLORS['error']
-        self.draw_glow_text(SCREEN, "ONLINE" if sensor_data and sensor_data.get('temperature') else "OFFLINE", self.font_small, status_color, 100, status_y)
+        self.draw_glow_text(SCREEN, "BME680:", self.font_small, COLORS['text_secondary'], 30, status_y, batch=text_blits)
+        status_color = COLORS['neon_green'] if temperature else COLORS['error']
+        self.draw_glow_text(SCREEN, "ONLINE" if temperature else "OFFLINE", self.font_small, status_color, 100, status_y, batch=text_blits)
         
         # GPS status
-        has_gps = gps_data and gps_data.get('latitude') and gps_data.get('longitude')
         gps_color = COLORS['neon_green'] if has_gps else COLORS['error']
-        self.draw_glow_text(SCREEN, "GPS:", self.font_small, COLORS['text_secondary'], 200, status_y)
-        self.draw_glow_text(SCREEN, "LOCKED" if has_gps else "SEARCHING", self.font_small, gps_color, 240, status_y)
+        self.draw_glow_text(SCREEN, "GPS:", self.font_small, COLORS['text_secondary'], 200, status_y, batch=text_blits)
+        self.draw_glow_text(SCREEN, "LOCKED" if has_gps else "SEARCHING", self.font_small, gps_color, 240, status_y, batch=text_blits)
+        SCREEN.blits(text_blits, doreturn=False)
         
         # Sensor data cards
-        if sensor_data:
-            temp_val = sensor_data.get('temperature', 0) if sensor_data.get('temperature') is not None else 0
-            hum_val = sensor_data.get('humidity', 0) if sensor_data.get('humidity') is not None else 0
-            press_val = sensor_data.get('pressure', 0) if sensor_data.get('pressure') is not None else 0
-            gas_val = sensor_data.get('gas', 0) if sensor_data.get('gas') is not None else 0
+        if readings:
+            # Missing readings show as zero
+            temp_val = temperature or 0
+            hum_val = readings.get('humidity') or 0
+            press_val = readings.get('pressure') or 0
+            gas_val = readings.get('gas') or 0
             
             self.draw_cyber_card(SCREEN, 30, 100, 120, 80, "TEMP", f"{temp_val:.1f}", "°C", COLORS['neon_orange'])
             self.draw_cyber_card(SCREEN, 160, 100, 120, 80, "HUMID", f"{hum_val:.0f}", "%", COLORS['neon_cyan'])
@@ -275,24 +388,24 @@ class CyberpunkGUI:
             self.draw_cyber_card(SCREEN, 420, 100, 120, 80, "VOC", f"{gas_val/1000:.1f}", "kΩ", COLORS['neon_green'])
         
         # GPS display
-        if sensor_data and sensor_data.get('latitude') and sensor_data.get('longitude'):
+        if latitude and longitude:
             gps_rect = pygame.Rect(550, 100, 220, 80)
             pygame.draw.rect(SCREEN, COLORS['panel'], gps_rect)
             self.draw_neon_rect(SCREEN, COLORS['neon_pink'], gps_rect, 2)
             
             self.draw_glow_text(SCREEN, "COORDINATES", self.font_small, COLORS['neon_pink'], 560, 110)
-            self.draw_glow_text(SCREEN, f"{sensor_data['latitude']:.5f}°", self.font_small, COLORS['text_primary'], 560, 130)
-            self.draw_glow_text(SCREEN, f"{sensor_data['longitude']:.5f}°", self.font_small, COLORS['text_primary'], 560, 145)
-            alt_val = sensor_data.get('altitude', 0) if sensor_data.get('altitude') is not None else 0
+            self.draw_glow_text(SCREEN, f"{latitude:.5f}°", self.font_small, COLORS['text_primary'], 560, 130)
+            self.draw_glow_text(SCREEN, f"{longitude:.5f}°", self.font_small, COLORS['text_primary'], 560, 145)
+            alt_val = altitude or 0
             self.draw_glow_text(SCREEN, f"ALT: {alt_val:.0f}m", self.font_small, COLORS['text_secondary'], 560, 160)
         
         # Graph section
-        if sensor_data and 'temperature' in sensor_data:
-            self.history.append(sensor_data['temperature'])
+        if 'temperature' in readings:
+            self.history.append(temperature)
         
         if len(self.history) > 1:
             self.draw_glow_text(SCREEN, "THERMAL ANALYSIS", self.font_medium, COLORS['neon_cyan'], 30, 200)
-            self.draw_cyber_graph(SCREEN, 30, 230, 500, 120, list(self.history))
+            self.draw_cyber_graph(SCREEN, 30, 230, 500, 120, self.history.values(), ticks)
         
         # Control interface
         button_text = "[STOP_REC]" if recording_status else "[START_REC]"
@@ -300,18 +413,33 @@ class CyberpunkGUI:
         
         # Recording status
         if recording_status:
-            pulse = int(100 + 155 * abs(math.sin(pygame.time.get_ticks() * 0.01)))
+            pulse = int(100 + 155 * abs(table_sin(ticks * 0.01)))
             rec_color = (255, pulse // 3, pulse // 3)
             self.draw_glow_text(SCREEN, "● REC", self.font_medium, rec_color, 550, 290, 5)
         
         # Data stream effect
         stream_y = 390
-        self.draw_glow_text(SCREEN, "> DATA_STREAM_ACTIVE", self.font_tiny, COLORS['neon_green'], 30, stream_y)
-        self.draw_glow_text(SCREEN, "> LOGGING_1HZ_CONTINUOUS", self.font_tiny, COLORS['neon_cyan'], 30, stream_y + 15)
-        self.draw_glow_text(SCREEN, "> SENSORS_MONITORING", self.font_tiny, COLORS['neon_pink'], 30, stream_y + 30)
-        
-        # Update display
-        pygame.display.flip()
+        stream_blits = []
+        self.draw_glow_text(SCREEN, "> DATA_STREAM_ACTIVE", self.font_tiny, COLORS['neon_green'], 30, stream_y, batch=stream_blits)
+        self.draw_glow_text(SCREEN, "> LOGGING_1HZ_CONTINUOUS", self.font_tiny, COLORS['neon_cyan'], 30, stream_y + 15, batch=stream_blits)
+        self.draw_glow_text(SCREEN, "> SENSORS_MONITORING", self.font_tiny, COLORS['neon_pink'], 30, stream_y + 30, batch=stream_blits)
+        SCREEN.blits(stream_blits, doreturn=False)
+        
+        # Present the whole screen when the data changed, else just the animations
+        static_key = (
+            tuple(readings.items()),
+            tuple(gps_readings.items()),
+            recording_status,
+            len(self.history) > 1,
+        )
+        if static_key != self._static_key:
+            self._static_key = static_key
+            self.dirty_rects = [SCREEN.get_rect()]
+        else:
+            self.dirty_rects = [CLOCK_RECT, GRAPH_RECT]
+            if recording_status:
+                self.dirty_rects.append(REC_RECT)
+        pygame.display.update(self.dirty_rects)
         
         return button_rect
 
@@ -379,7 +507,6 @@ if __name__ == "__main__":
                     running = False
         
         button_rect = gui.render(sample_sensor, sample_gps, gui.recording)
-        pygame.display.flip()
         clock.tick(30)
     
     pygame.quit()
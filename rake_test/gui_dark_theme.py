@@ -6,8 +6,9 @@ Sleek dark interface with blue accents and modern typography
 import os
 import pygame
 import math
+import numpy as np
 from typing import Dict, Any, List
-from collections import deque
+from gui_helpers import HistoryBuffer, TextCache
 
 # Set up display - auto-detect best driver
 pygame.init()
@@ -62,30 +63,42 @@ class ModernDarkGUI:
         self.font_tiny = pygame.font.Font(None, 18)
         
         self.recording = False
-        self.history = deque(maxlen=120)
+        self.history = HistoryBuffer(120)
         
         # UI Layout
         self.left_panel_width = 300
         self.right_panel_width = WIDTH - self.left_panel_width
         
+        # Gradient surfaces keyed by (color1, color2, size)
+        self._gradient_cache = {}
+        
+        # Rendered text surfaces keyed by (font, text, color), FIFO-bounded
+        self._text_cache = TextCache()
+        
+    def get_gradient_surface(self, color1, color2, size):
+        """Return a cached vertical gradient surface, rendering it on first use"""
+        key = (color1, color2, size)
+        gradient = self._gradient_cache.get(key)
+        if gradient is None:
+            width, height = size
+            # One colour per row, computed for all rows at once
+            ratio = (np.arange(height) / height)[:, None]
+            column = (np.array(color1) * (1 - ratio) + np.array(color2) * ratio).astype(np.uint8)
+            
+            # Repeat the column across the surface (surfarray is indexed x, y)
+            gradient = pygame.Surface(size)
+            pygame.surfarray.blit_array(gradient, np.broadcast_to(column, (width, height, 3)))
+            gradient = gradient.convert()
+            self._gradient_cache[key] = gradient
+        return gradient
+    
     def draw_gradient_rect(self, surface, color1, color2, rect):
         """Draw a vertical gradient rectangle"""
-        for y in range(rect.height):
-            ratio = y / rect.height
-            r = int(color1[0] * (1 - ratio) + color2[0] * ratio)
-            g = int(color1[1] * (1 - ratio) + color2[1] * ratio)
-            b = int(color1[2] * (1 - ratio) + color2[2] * ratio)
-            pygame.draw.line(surface, (r, g, b), 
-                           (rect.x, rect.y + y), (rect.x + rect.width, rect.y + y))
+        surface.blit(self.get_gradient_surface(color1, color2, rect.size), rect)
     
     def draw_rounded_rect(self, surface, color, rect, radius=10):
         """Draw a rounded rectangle"""
-        pygame.draw.rect(surface, color, rect)
-        # Simple rounded corners effect
-        pygame.draw.circle(surface, color, (rect.x + radius, rect.y + radius), radius)
-        pygame.draw.circle(surface, color, (rect.x + rect.width - radius, rect.y + radius), radius)
-        pygame.draw.circle(surface, color, (rect.x + radius, rect.y + rect.height - radius), radius)
-        pygame.draw.circle(surface, color, (rect.x + rect.width - radius, rect.y + rect.height - radius), radius)
+        pygame.draw.rect(surface, color, rect, border_radius=radius)
     
     def draw_sensor_card(self, surface, x, y, width, height, title, value, unit, icon="●"):
         """Draw a modern sensor data card"""
@@ -97,15 +110,15 @@ class ModernDarkGUI:
         pygame.draw.rect(surface, COLORS['border'], card_rect, 2)
         
         # Icon and title
-        icon_text = self.font_medium.render(icon, True, COLORS['accent'])
-        title_text = self.font_small.render(title, True, COLORS['text_secondary'])
+        icon_text = self._text_cache.render(self.font_medium, icon, COLORS['accent'])
+        title_text = self._text_cache.render(self.font_small, title, COLORS['text_secondary'])
         
         surface.blit(icon_text, (x + 15, y + 10))
         surface.blit(title_text, (x + 45, y + 15))
         
         # Value
-        value_text = self.font_large.render(f"{value}", True, COLORS['text_primary'])
-        unit_text = self.font_small.render(unit, True, COLORS['text_secondary'])
+        value_text = self._text_cache.render(self.font_large, f"{value}", COLORS['text_primary'])
+        unit_text = self._text_cache.render(self.font_small, unit, COLORS['text_secondary'])
         
         surface.blit(value_text, (x + 15, y + 40))
         surface.blit(unit_text, (x + 15 + value_text.get_width() + 5, y + 55))
@@ -114,7 +127,7 @@ class ModernDarkGUI:
         """Draw a status indicator with colored dot"""
         color = COLORS['success'] if status else COLORS['error']
         pygame.draw.circle(surface, color, (x, y), 6)
-        status_text = self.font_small.render(text, True, COLORS['text_secondary'])
+        status_text = self._text_cache.render(self.font_small, text, COLORS['text_secondary'])
         surface.blit(status_text, (x + 15, y - 8))
     
     def draw_modern_graph(self, surface, x, y, width, height, data_points):
@@ -133,23 +146,26 @@ class ModernDarkGUI:
         
         # Data line with glow effect
         if len(data_points) > 1:
-            points = []
-            min_val = min(data_points)
-            max_val = max(data_points)
+            values = np.asarray(data_points, dtype=np.float64)
+            point_count = len(values)
+            
+            min_val = values.min()
+            max_val = values.max()
             val_range = max_val - min_val if max_val > min_val else 1
             
-            for i, val in enumerate(data_points):
-                px = x + (i * width // len(data_points))
-                py = y + height - int(((val - min_val) / val_range) * height)
-                points.append((px, py))
+            # Project all readings at once
+            xs = x + np.arange(point_count) * width // point_count
+            ys = y + height - (((values - min_val) / val_range) * height).astype(np.int32)
+            # Line in glow-surface coordinates, shared by every glow pass
+            glow_points = list(zip((xs - x + 5).tolist(), (ys - y + 5).tolist()))
             
             # Glow effect (multiple lines with decreasing opacity)
             for thickness in [5, 3, 1]:
                 alpha = 50 if thickness == 5 else (100 if thickness == 3 else 255)
                 temp_surf = pygame.Surface((width + 10, height + 10), pygame.SRCALPHA)
-                if len(points) > 1:
+                if len(glow_points) > 1:
                     pygame.draw.lines(temp_surf, (*COLORS['graph_line'], alpha), False, 
-                                    [(p[0] - x + 5, p[1] - y + 5) for p in points], thickness)
+                                    glow_points, thickness)
                 surface.blit(temp_surf, (x - 5, y - 5), special_flags=pygame.BLEND_ALPHA_SDL2)
     
     def draw_control_button(self, surface, x, y, width, height, text, active=False):
@@ -162,7 +178,7 @@ class ModernDarkGUI:
         self.draw_rounded_rect(surface, color, button_rect, 12)
         
         # Button text
-        text_surface = self.font_medium.render(text, True, COLORS['text_primary'])
+        text_surface = self._text_cache.render(self.font_medium, text, COLORS['text_primary'])
         text_rect = text_surface.get_rect(center=button_rect.center)
         surface.blit(text_surface, text_rect)
         
@@ -174,7 +190,7 @@ class ModernDarkGUI:
         self.draw_gradient_rect(SCREEN, COLORS['bg'], (15, 20, 30), pygame.Rect(0, 0, WIDTH, HEIGHT))
         
         # Header
-        header_text = self.font_large.render("Environmental Monitor", True, COLORS['text_primary'])
+        header_text = self._text_cache.render(self.font_large, "Environmental Monitor", COLORS['text_primary'])
         SCREEN.blit(header_text, (20, 20))
         
         # Status indicators
@@ -194,12 +210,12 @@ class ModernDarkGUI:
             self.draw_rounded_rect(SCREEN, COLORS['panel'], gps_rect, 8)
             pygame.draw.rect(SCREEN, COLORS['border'], gps_rect, 2)
             
-            gps_title = self.font_medium.render("📍 Location", True, COLORS['accent'])
+            gps_title = self._text_cache.render(self.font_medium, "📍 Location", COLORS['accent'])
             SCREEN.blit(gps_title, (35, 305))
             
-            lat_text = self.font_small.render(f"Lat: {gps_data.get('latitude', 0):.4f}°", True, COLORS['text_primary'])
-            lon_text = self.font_small.render(f"Lon: {gps_data.get('longitude', 0):.4f}°", True, COLORS['text_primary'])
-            alt_text = self.font_small.render(f"Alt: {gps_data.get('altitude', 0):.1f}m", True, COLORS['text_primary'])
+            lat_text = self._text_cache.render(self.font_small, f"Lat: {gps_data.get('latitude', 0):.4f}°", COLORS['text_primary'])
+            lon_text = self._text_cache.render(self.font_small, f"Lon: {gps_data.get('longitude', 0):.4f}°", COLORS['text_primary'])
+            alt_text = self._text_cache.render(self.font_small, f"Alt: {gps_data.get('altitude', 0):.1f}m", COLORS['text_primary'])
             
             SCREEN.blit(lat_text, (35, 330))
             SCREEN.blit(lon_text, (35, 350))
@@ -210,10 +226,10 @@ class ModernDarkGUI:
             self.history.append(sensor_data['temperature'])
         
         if len(self.history) > 1:
-            self.draw_modern_graph(SCREEN, 320, 80, 460, 200, list(self.history))
+            self.draw_modern_graph(SCREEN, 320, 80, 460, 200, self.history.values())
             
             # Graph title
-            graph_title = self.font_medium.render("Temperature Trend", True, COLORS['text_primary'])
+            graph_title = self._text_cache.render(self.font_medium, "Temperature Trend", COLORS['text_primary'])
             SCREEN.blit(graph_title, (320, 50))
         
         # Control Button
@@ -221,7 +237,7 @@ class ModernDarkGUI:
         button_rect = self.draw_control_button(SCREEN, 320, 320, 200, 50, button_text, recording_status)
         
         # Footer
-        footer_text = self.font_tiny.render("Tap to start/stop • Data logged to CSV", True, COLORS['text_secondary'])
+        footer_text = self._text_cache.render(self.font_tiny, "Tap to start/stop • Data logged to CSV", COLORS['text_secondary'])
         SCREEN.blit(footer_text, (20, HEIGHT - 25))
         
         return button_rect
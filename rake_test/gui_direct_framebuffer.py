@@ -6,10 +6,19 @@ Works directly with DRM framebuffer for DSI displays
 
 import pygame
 import os
+import mmap
 import time
 import math
 import random
-from collections import deque
+import numpy as np
+from gui_helpers import HistoryBuffer, TextCache
+
+# Numba is optional - RGB565 packing falls back to vectorized NumPy without it
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
 
 # Force pygame to use dummy driver but capture the surface
 os.environ['SDL_VIDEODRIVER'] = 'dummy'
@@ -37,6 +46,38 @@ COLORS = {
     'reading_border': (150, 180, 150),
 }
 
+# Frames between history updates (3 seconds at the demo's 30 fps)
+HISTORY_UPDATE_FRAMES = 90
+
+# Fixed screen areas
+GPS_RECT = pygame.Rect(40, 65, 420, 80)
+BUTTON_RECT = pygame.Rect(350, 380, 100, 40)
+
+# Maximum number of ring surfaces kept in the cache (rings of all three sensors fit)
+RING_CACHE_SIZE = 512
+
+if NUMBA_AVAILABLE:
+    # Compiled eagerly for the one argument layout used - strided surface rows into
+    # framebuffer bytes - with the row width fixed at the display's WIDTH
+    @njit('void(uint8[:, :, :], uint8[:])', parallel=True, cache=True)
+    def pack_rgb565(rgb, out):
+        """Pack (H, WIDTH, 3) RGB pixels into little-endian RGB565 bytes (compiled with Numba)"""
+        for y in prange(rgb.shape[0]):
+            row = y * WIDTH * 2
+            for x in range(WIDTH):
+                r = int(rgb[y, x, 0])
+                g = int(rgb[y, x, 1])
+                b = int(rgb[y, x, 2])
+                rgb565 = ((r >> 3) << 11) | ((g >> 2) << 5) | (b >> 3)
+                out[row + 2 * x] = rgb565 & 0xFF
+                out[row + 2 * x + 1] = rgb565 >> 8
+else:
+    def pack_rgb565(rgb, out):
+        """Pack (H, WIDTH, 3) RGB pixels into little-endian RGB565 bytes (vectorized NumPy)"""
+        rgb = rgb.astype(np.uint16)
+        rgb565 = ((rgb[..., 0] >> 3) << 11) | ((rgb[..., 1] >> 2) << 5) | (rgb[..., 2] >> 3)
+        out[:] = rgb565.astype('<u2').view(np.uint8).reshape(-1)
+
 class DirectDisplayGUI:
     def __init__(self):
         self.font_title = pygame.font.Font(None, 36)
@@ -45,59 +86,175 @@ class DirectDisplayGUI:
         self.font_small = pygame.font.Font(None, 20)
         
         # Data history
-        self.temp_history = deque(maxlen=50)
-        self.humidity_history = deque(maxlen=50)
-        self.pressure_history = deque(maxlen=50)
+        self.temp_history = HistoryBuffer(50)
+        self.humidity_history = HistoryBuffer(50)
+        self.pressure_history = HistoryBuffer(50)
         
-        self.time = 0
+        self._frame = 0  # Frames rendered, drives the history update cadence
         self.recording = False
         
+        # Framebuffer device, mapped on first write and kept mapped
+        self.fb = None
+        self.fb_map = None
+        self.fb_pixels = None
+        
+        # Ring surfaces keyed by (radius, alpha, thickness, color), FIFO-bounded
+        self._ring_cache = {}
+        # Shared drawing area for cache misses, grown to fit the largest ring
+        self._ring_scratch = None
+        
+        # Rendered text surfaces keyed by (font, text, color), FIFO-bounded
+        self._text_cache = TextCache()
+        
+        # Ring blits per (label, center, max_radius), rebuilt only when the history changes
+        self._ring_blits = {}
+        
+        # What each tracked screen area showed last frame, to find the areas that changed
+        self._region_keys = {}
+        self._full_redraw = True
+        self.dirty_rects = []
+        
+        # Background never changes - build it once
+        self.bg_surface = self.build_background()
+        
+        # Fixed text, rendered once
+        self.title_surf = self.font_title.render("Forest Growth Monitor", True, COLORS['accent1']).convert_alpha()
+        self.title_rect = self.title_surf.get_rect(center=(WIDTH // 2, 30))
+        self.status_surfs = {
+            True: self.font_medium.render("GROWING", True, COLORS['accent1']).convert_alpha(),
+            False: self.font_medium.render("PAUSED", True, COLORS['accent2']).convert_alpha(),
+        }
+        self.status_rect = self.status_surfs[True].get_rect(topleft=(WIDTH - 100, 10)).union(
+            self.status_surfs[False].get_rect(topleft=(WIDTH - 100, 10)))
+        self.rings_title_surf = self.font_large.render("Data Tree Rings", True, COLORS['text']).convert_alpha()
+        self.inst1_surf = self.font_small.render("Tree rings grow as sensor data changes", True, COLORS['text_dim']).convert_alpha()
+        self.inst2_surf = self.font_small.render("Direct framebuffer display - should be visible!", True, COLORS['text_dim']).convert_alpha()
+        
+        # Rounded boxes with their fixed captions, rendered once
+        self.gps_panel = self.build_panel((420, 80), COLORS['reading_bg'], COLORS['gps'], 10)
+        self.gps_panel.blit(self.font_large.render("LOCATION", True, COLORS['gps']), (10, 10))
+        self.gps_panel = self.gps_panel.convert_alpha()
+        self.reading_boxes = {}
+        for label in ("Temperature", "Humidity", "Pressure"):
+            box = self.build_panel((100, 45), COLORS['reading_bg'], COLORS['reading_border'], 8)
+            label_surface = self.font_small.render(label, True, COLORS['text_dim'])
+            box.blit(label_surface, label_surface.get_rect(center=(50, 12)))
+            self.reading_boxes[label] = box.convert_alpha()
+        self.button_surfs = {}
+        for recording, caption in ((True, "PAUSE"), (False, "START")):
+            button = self.build_panel((100, 40), COLORS['accent2'] if recording else COLORS['accent1'], None, 10)
+            text_surface = self.font_medium.render(caption, True, COLORS['bg'])
+            button.blit(text_surface, text_surface.get_rect(center=(50, 20)))
+            self.button_surfs[recording] = button.convert_alpha()
+        
         # Initialize with sample data
         for i in range(20):
             self.temp_history.append(22.0 + random.uniform(-2, 2))
             self.humidity_history.append(65.0 + random.uniform(-10, 10))
             self.pressure_history.append(1013.0 + random.uniform(-5, 5))
     
-    def draw_tree_rings(self, surface, center_x, center_y, data_history, ring_color, current_value, unit, label, max_radius=70):
-        """Draw tree rings with separate readings"""
+    def build_background(self):
+        """Build the full-screen background gradient surface"""
+        # One colour per row, computed for all rows at once
+        ratio = (np.arange(HEIGHT) / HEIGHT)[:, None]
+        bg = np.array(COLORS['bg'])
+        column = (bg + (np.array(COLORS['bg_light']) - bg) * ratio).astype(np.uint8)
+        
+        # Repeat the column across the surface (surfarray is indexed x, y)
+        background = pygame.Surface((WIDTH, HEIGHT))
+        pygame.surfarray.blit_array(background, np.broadcast_to(column, (WIDTH, HEIGHT, 3)))
+        return background.convert()
+    
+    def build_panel(self, size, fill_color, border_color, radius):
+        """Build a rounded box surface with an optional 2px border"""
+        panel = pygame.Surface(size, pygame.SRCALPHA)
+        panel_rect = panel.get_rect()
+        pygame.draw.rect(panel, fill_color, panel_rect, border_radius=radius)
+        if border_color:
+            pygame.draw.rect(panel, border_color, panel_rect, 2, border_radius=radius)
+        return panel
+    
+    def get_ring_surface(self, ring_radius, alpha, thickness, ring_color):
+        """Return a cached ring surface, rendering it on first use"""
+        key = (ring_radius, alpha, thickness, ring_color)
+        ring_surface = self._ring_cache.get(key)
+        if ring_surface is None:
+            if len(self._ring_cache) >= RING_CACHE_SIZE:
+                # Evict the oldest entry
+                del self._ring_cache[next(iter(self._ring_cache))]
+            # Draw into a cleared corner of the scratch surface, the cached copy is
+            # the only allocation
+            size = ring_radius * 2 + 4
+            if self._ring_scratch is None or self._ring_scratch.get_width() < size:
+                self._ring_scratch = pygame.Surface((size, size), pygame.SRCALPHA)
+            ring_area = self._ring_scratch.subsurface((0, 0, size, size))
+            ring_area.fill((0, 0, 0, 0))
+            pygame.draw.circle(ring_area, (*ring_color[:3], alpha),
+                             (ring_radius + 2, ring_radius + 2), ring_radius, thickness)
+            ring_surface = ring_area.convert_alpha()
+            self._ring_cache[key] = ring_surface
+        return ring_surface
+    
+    def track_region(self, rect, shown):
+        """Mark rect dirty when what it shows differs from the last frame"""
+        region = tuple(rect)
+        if region not in self._region_keys or self._region_keys[region] != shown:
+            self._region_keys[region] = shown
+            self.dirty_rects.append(rect)
+    
+    def reading_rect(self, center_x, center_y, max_radius=70):
+        """Screen area of the current reading box below a ring cluster"""
+        reading_width, reading_height = 100, 45
+        return pygame.Rect(center_x - reading_width // 2, center_y + max_radius + 25,
+                           reading_width, reading_height)
+    
+    def ring_layout(self, data_history, max_radius):
+        """Return (radius, alpha, thickness) for each ring, oldest first"""
+        data_values = data_history.values()
+        min_val = data_values.min()
+        max_val = data_values.max()
+        if max_val == min_val:
+            return []
+        
+        # Ring sizes, opacities and widths for all rings at once (newer = more opaque)
+        ring_count = len(data_values)
+        ages = np.arange(ring_count)
+        radii = (10 + (data_values - min_val) / (max_val - min_val) * max_radius).astype(np.int32)
+        alphas = (60 + ages / ring_count * 140).astype(np.int32)
+        thicknesses = np.where(ages < ring_count - 3, 1, 2)
+        return list(zip(radii.tolist(), alphas.tolist(), thicknesses.tolist()))
+    
+    def draw_tree_rings(self, surface, center_x, center_y, data_history, ring_color, current_value, unit, label, max_radius=70, batch=None):
+        """Draw tree rings with separate readings, or queue the ring blits onto batch"""
+        reading_rect = self.reading_rect(center_x, center_y, max_radius)
         if len(data_history) < 2:
+            self.track_region(reading_rect, None)
             return
         
-        data_list = list(data_history)
-        min_val = min(data_list)
-        max_val = max(data_list)
-        
-        if max_val != min_val:
-            for i, value in enumerate(data_list):
-                normalized = (value - min_val) / (max_val - min_val)
-                ring_radius = int(10 + normalized * max_radius)
-                age_factor = i / len(data_list)
-                alpha = int(60 + age_factor * 140)
-                thickness = 1 if i < len(data_list) - 3 else 2
-                
-                # Create ring with alpha
-                ring_surface = pygame.Surface((ring_radius * 2 + 4, ring_radius * 2 + 4), pygame.SRCALPHA)
-                ring_color_alpha = (*ring_color[:3], alpha)
-                pygame.draw.circle(ring_surface, ring_color_alpha, 
-                                 (ring_radius + 2, ring_radius + 2), ring_radius, thickness)
-                surface.blit(ring_surface, (center_x - ring_radius - 2, center_y - ring_radius - 2))
+        blits_key = (label, center_x, center_y, max_radius)
+        ring_blits = self._ring_blits.get(blits_key)
+        if ring_blits is None:
+            ring_blits = [
+                (self.get_ring_surface(ring_radius, alpha, thickness, ring_color),
+                 (center_x - ring_radius - 2, center_y - ring_radius - 2))
+                for ring_radius, alpha, thickness in self.ring_layout(data_history, max_radius)
+            ]
+            self._ring_blits[blits_key] = ring_blits
         
-        # Reading box
-        reading_width, reading_height = 100, 45
-        reading_x = center_x - reading_width // 2
-        reading_y = center_y + max_radius + 25
+        # Rings end above the reading box, so a batch may be flushed after it is drawn
+        if batch is None:
+            surface.blits(ring_blits, doreturn=False)
+        else:
+            batch.extend(ring_blits)
         
-        reading_rect = pygame.Rect(reading_x, reading_y, reading_width, reading_height)
-        pygame.draw.rect(surface, COLORS['reading_bg'], reading_rect, border_radius=8)
-        pygame.draw.rect(surface, COLORS['reading_border'], reading_rect, 2, border_radius=8)
+        # Reading box
+        reading_y = reading_rect.y
+        surface.blit(self.reading_boxes[label], reading_rect)
         
         # Text
-        label_surface = self.font_small.render(label, True, COLORS['text_dim'])
-        label_rect = label_surface.get_rect(center=(center_x, reading_y + 12))
-        surface.blit(label_surface, label_rect)
-        
         value_text = f"{current_value:.1f}{unit}"
-        value_surface = self.font_medium.render(value_text, True, COLORS['text'])
+        self.track_region(reading_rect, value_text)
+        value_surface = self._text_cache.render(self.font_medium, value_text, COLORS['text'])
         value_rect = value_surface.get_rect(center=(center_x, reading_y + 28))
         surface.blit(value_surface, value_rect)
     
@@ -106,119 +263,126 @@ class DirectDisplayGUI:
             self.temp_history.append(sensor_data.get('temperature', 22.0))
             self.humidity_history.append(sensor_data.get('humidity', 65.0))
             self.pressure_history.append(sensor_data.get('pressure', 1013.0))
+            self._ring_blits.clear()
+            self._full_redraw = True
     
-    def write_to_framebuffer(self, surface):
-        """Write pygame surface directly to framebuffer"""
+    def write_to_framebuffer(self, surface, dirty_rects=None):
+        """Write pygame surface directly to framebuffer, only the rows of dirty_rects if given"""
+        if dirty_rects is not None and not dirty_rects:
+            # Nothing changed since the last write
+            return
+        
         try:
-            # Convert pygame surface to raw RGB data
-            raw_data = pygame.image.tostring(surface, 'RGB')
+            if self.fb_map is None:
+                if self.fb is None:
+                    self.fb = open('/dev/fb0', 'r+b', buffering=0)
+                self.fb_map = mmap.mmap(self.fb.fileno(), WIDTH * HEIGHT * 2)
+                # Byte view of the mapping, so frames are packed straight into it
+                self.fb_pixels = np.frombuffer(self.fb_map, dtype=np.uint8)
             
-            # Write to framebuffer
-            with open('/dev/fb0', 'wb') as fb:
-                # Convert RGB to framebuffer format (assuming RGB565)
-                fb_data = bytearray()
-                for i in range(0, len(raw_data), 3):
-                    if i + 2 < len(raw_data):
-                        r = raw_data[i] >> 3      # 5 bits
-                        g = raw_data[i+1] >> 2    # 6 bits  
-                        b = raw_data[i+2] >> 3    # 5 bits
-                        
-                        # Pack into RGB565
-                        rgb565 = (r << 11) | (g << 5) | b
-                        fb_data.append(rgb565 & 0xFF)
-                        fb_data.append((rgb565 >> 8) & 0xFF)
-                
-                fb.write(fb_data)
+            # Framebuffer rows are contiguous, so merge the dirty rects into row spans
+            if dirty_rects is None:
+                dirty_rects = [surface.get_rect()]
+            spans = []
+            for top, bottom in sorted((max(rect.top, 0), min(rect.bottom, HEIGHT)) for rect in dirty_rects):
+                if spans and top <= spans[-1][1]:
+                    spans[-1][1] = max(spans[-1][1], bottom)
+                elif top < bottom:
+                    spans.append([top, bottom])
+            
+            # View the surface pixels in place as (HEIGHT, WIDTH, 3) - no copy
+            pixels = pygame.surfarray.pixels3d(surface).swapaxes(0, 1)
+            row_bytes = WIDTH * 2
+            for top, bottom in spans:
+                start, end = top * row_bytes, bottom * row_bytes
+                # Convert RGB to framebuffer format (assuming little-endian RGB565)
+                pack_rgb565(pixels[top:bottom], self.fb_pixels[start:end])
+            
+            # Release the surface lock held by the pixel view
+            del pixels
                 
         except Exception as e:
             print(f"Framebuffer write failed: {e}")
+            # The framebuffer may now be stale anywhere - resend it all next frame
+            self._full_redraw = True
     
     def render(self, sensor_data, gps_data, recording_status):
         self.recording = recording_status
-        self.time += 0.05
+        self.dirty_rects = []
+        self._frame += 1
         
-        if self.recording and sensor_data:
-            if int(self.time * 10) % 30 == 0:
+        # Snapshot the readings once
+        readings = sensor_data or {}
+        current_temp = readings.get('temperature', 22.0)
+        current_hum = readings.get('humidity', 65.0)
+        current_press = readings.get('pressure', 1013.0)
+        gps_readings = gps_data or {}
+        latitude = gps_readings.get('latitude')
+        recording = bool(recording_status)
+        
+        if recording and sensor_data:
+            if self._frame % HISTORY_UPDATE_FRAMES == 0:
                 self.update_data(sensor_data)
         
         # Draw background gradient
-        for y in range(HEIGHT):
-            ratio = y / HEIGHT
-            bg_color = (
-                int(COLORS['bg'][0] + (COLORS['bg_light'][0] - COLORS['bg'][0]) * ratio),
-                int(COLORS['bg'][1] + (COLORS['bg_light'][1] - COLORS['bg'][1]) * ratio),
-                int(COLORS['bg'][2] + (COLORS['bg_light'][2] - COLORS['bg'][2]) * ratio)
-            )
-            pygame.draw.line(screen, bg_color, (0, y), (WIDTH, y))
+        screen.blit(self.bg_surface, (0, 0))
         
         # Title
-        title = self.font_title.render("Forest Growth Monitor", True, COLORS['accent1'])
-        title_rect = title.get_rect(center=(WIDTH // 2, 30))
-        screen.blit(title, title_rect)
+        screen.blit(self.title_surf, self.title_rect)
         
         # Status
-        status = "GROWING" if self.recording else "PAUSED"
-        status_color = COLORS['accent1'] if self.recording else COLORS['accent2']
-        status_surface = self.font_medium.render(status, True, status_color)
-        screen.blit(status_surface, (WIDTH - 100, 10))
+        screen.blit(self.status_surfs[recording], (WIDTH - 100, 10))
+        self.track_region(self.status_rect, recording)
         
         # GPS Display
-        if gps_data and gps_data.get('latitude'):
+        if latitude:
             gps_y = 70
-            gps_rect = pygame.Rect(40, gps_y - 5, 420, 80)
-            pygame.draw.rect(screen, COLORS['reading_bg'], gps_rect, border_radius=10)
-            pygame.draw.rect(screen, COLORS['gps'], gps_rect, 2, border_radius=10)
-            
-            gps_header = self.font_large.render("LOCATION", True, COLORS['gps'])
-            screen.blit(gps_header, (50, gps_y + 5))
+            screen.blit(self.gps_panel, GPS_RECT)
             
-            lat_text = f"Lat: {gps_data['latitude']:.7f}°"
-            lon_text = f"Lon: {gps_data['longitude']:.7f}°"
-            alt_text = f"Alt: {gps_data.get('altitude', 0):.1f}m"
+            lat_text = f"Lat: {latitude:.7f}°"
+            lon_text = f"Lon: {gps_readings['longitude']:.7f}°"
+            alt_text = f"Alt: {gps_readings.get('altitude', 0):.1f}m"
             
-            lat_surface = self.font_medium.render(lat_text, True, COLORS['text'])
-            lon_surface = self.font_medium.render(lon_text, True, COLORS['text'])
-            alt_surface = self.font_small.render(alt_text, True, COLORS['accent1'])
+            lat_surface = self._text_cache.render(self.font_medium, lat_text, COLORS['text'])
+            lon_surface = self._text_cache.render(self.font_medium, lon_text, COLORS['text'])
+            alt_surface = self._text_cache.render(self.font_small, alt_text, COLORS['accent1'])
             
             screen.blit(lat_surface, (50, gps_y + 25))
             screen.blit(lon_surface, (50, gps_y + 45))
             screen.blit(alt_surface, (350, gps_y + 35))
+            self.track_region(GPS_RECT, (lat_text, lon_text, alt_text))
+        else:
+            self.track_region(GPS_RECT, None)
         
         # Tree rings
         rings_y = 180
-        rings_title = self.font_large.render("Data Tree Rings", True, COLORS['text'])
-        rings_title_rect = rings_title.get_rect(center=(WIDTH // 2, rings_y - 20))
-        screen.blit(rings_title, rings_title_rect)
-        
-        current_temp = sensor_data.get('temperature', 22.0) if sensor_data else 22.0
-        current_hum = sensor_data.get('humidity', 65.0) if sensor_data else 65.0
-        current_press = sensor_data.get('pressure', 1013.0) if sensor_data else 1013.0
+        rings_title_rect = self.rings_title_surf.get_rect(center=(WIDTH // 2, rings_y - 20))
+        screen.blit(self.rings_title_surf, rings_title_rect)
         
+        # All three clusters' rings go out in one blit batch
+        ring_blits = []
         self.draw_tree_rings(screen, 150, rings_y + 40, self.temp_history, COLORS['ring_temp'], 
-                           current_temp, "°C", "Temperature")
+                           current_temp, "°C", "Temperature", batch=ring_blits)
         self.draw_tree_rings(screen, 400, rings_y + 40, self.humidity_history, COLORS['ring_hum'],
-                           current_hum, "%", "Humidity")
+                           current_hum, "%", "Humidity", batch=ring_blits)
         self.draw_tree_rings(screen, 650, rings_y + 40, self.pressure_history, COLORS['ring_press'],
-                           current_press, " hPa", "Pressure")
+                           current_press, " hPa", "Pressure", batch=ring_blits)
+        screen.blits(ring_blits, doreturn=False)
         
         # Control button
-        button_text = "PAUSE" if self.recording else "START"
-        button_rect = pygame.Rect(350, 380, 100, 40)
-        button_color = COLORS['accent2'] if self.recording else COLORS['accent1']
-        pygame.draw.rect(screen, button_color, button_rect, border_radius=10)
-        
-        text_surface = self.font_medium.render(button_text, True, COLORS['bg'])
-        text_rect = text_surface.get_rect(center=button_rect.center)
-        screen.blit(text_surface, text_rect)
+        button_rect = BUTTON_RECT
+        screen.blit(self.button_surfs[recording], button_rect)
+        self.track_region(button_rect, recording)
         
         # Instructions
-        inst1 = self.font_small.render("Tree rings grow as sensor data changes", True, COLORS['text_dim'])
-        inst2 = self.font_small.render("Direct framebuffer display - should be visible!", True, COLORS['text_dim'])
-        screen.blit(inst1, (50, 450))
-        screen.blit(inst2, (50, 465))
+        screen.blit(self.inst1_surf, (50, 450))
+        screen.blit(self.inst2_surf, (50, 465))
         
-        # Write to framebuffer
-        self.write_to_framebuffer(screen)
+        # Write the changed areas to framebuffer - everything when the rings moved
+        if self._full_redraw:
+            self.dirty_rects = [screen.get_rect()]
+            self._full_redraw = False
+        self.write_to_framebuffer(screen, self.dirty_rects)
         
         return button_rect
 
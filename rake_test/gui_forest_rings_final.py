@@ -8,6 +8,7 @@ import math
 import random
 import os
 import time
+import numpy as np
 from collections import deque
 
 # Set up display - Pi-optimized driver priority
@@ -70,6 +71,15 @@ COLORS = {
     'reading_border': (150, 180, 150), # Reading border
 }
 
+# Frames between history updates (3 seconds at the demo's 30 fps)
+HISTORY_UPDATE_FRAMES = 90
+
+# Maximum number of ring surfaces kept in the cache (rings of all three sensors fit)
+RING_CACHE_SIZE = 512
+
+# Screen areas changed every frame - each ring cluster (radius up to 82) with its reading box
+RING_RECTS = [pygame.Rect(center_x - 82, 138, 164, 222) for center_x in (150, 400, 650)]
+
 class ForestRingsGUI:
     def __init__(self):
         self.font_title = pygame.font.Font(None, 36)
@@ -82,15 +92,68 @@ class ForestRingsGUI:
         self.humidity_history = deque(maxlen=50)
         self.pressure_history = deque(maxlen=50)
         
-        self.time = 0
+        self._frame = 0  # Frames rendered, drives the history update cadence
         self.recording = False
         
+        # Ring surfaces keyed by (radius, alpha, thickness, color), FIFO-bounded
+        self._ring_cache = {}
+        # Shared drawing area for cache misses, grown to fit the largest ring
+        self._ring_scratch = None
+        
+        # Ring layouts per (label, max_radius), rebuilt only when the history changes
+        self._ring_layouts = {}
+        
+        # What the rest of the screen showed last frame
+        self._static_key = None
+        # Screen regions changed by the last render, for display.update()
+        self.dirty_rects = []
+        
+        # Background gradient never changes - build it once
+        self.bg_surface = self.build_background()
+        
+        # Fixed text, rendered once
+        self.title_surf = self.font_title.render("Forest Growth Monitor", True, COLORS['accent1']).convert_alpha()
+        self.title_rect = self.title_surf.get_rect(center=(WIDTH // 2, 30))
+        self.gps_header_surf = self.font_large.render("LOCATION", True, COLORS['gps']).convert_alpha()
+        self.rings_title_surf = self.font_large.render("Data Tree Rings", True, COLORS['text']).convert_alpha()
+        self.rings_title_rect = self.rings_title_surf.get_rect(center=(WIDTH // 2, 160))
+        self.inst1_surf = self.font_small.render("Tree rings grow as sensor data changes over time", True, COLORS['text_dim']).convert_alpha()
+        self.inst2_surf = self.font_small.render("Each ring represents a data point - newer rings are brighter", True, COLORS['text_dim']).convert_alpha()
+        
+        # Reading boxes with their fixed labels, rendered once
+        self.reading_boxes = {}
+        for label in ("Temperature", "Humidity", "Pressure"):
+            box = self.build_panel((100, 45), COLORS['reading_bg'], COLORS['reading_border'], 8)
+            label_surface = self.font_small.render(label, True, COLORS['text_dim'])
+            box.blit(label_surface, label_surface.get_rect(center=(50, 12)))
+            self.reading_boxes[label] = box.convert_alpha()
+        
         # Initialize with some sample data
         for i in range(20):
             self.temp_history.append(22.0 + random.uniform(-2, 2))
             self.humidity_history.append(65.0 + random.uniform(-10, 10))
             self.pressure_history.append(1013.0 + random.uniform(-5, 5))
     
+    def build_background(self):
+        """Build the full-screen background gradient surface"""
+        # One colour per row, computed for all rows at once
+        ratio = (np.arange(HEIGHT) / HEIGHT)[:, None]
+        bg = np.array(COLORS['bg'])
+        column = (bg + (np.array(COLORS['bg_light']) - bg) * ratio).astype(np.uint8)
+        
+        # Repeat the column across the surface (surfarray is indexed x, y)
+        background = pygame.Surface((WIDTH, HEIGHT))
+        pygame.surfarray.blit_array(background, np.broadcast_to(column, (WIDTH, HEIGHT, 3)))
+        return background.convert()
+    
+    def build_panel(self, size, fill_color, border_color, radius):
+        """Build a rounded box surface with a 2px border"""
+        panel = pygame.Surface(size, pygame.SRCALPHA)
+        panel_rect = panel.get_rect()
+        pygame.draw.rect(panel, fill_color, panel_rect, border_radius=radius)
+        pygame.draw.rect(panel, border_color, panel_rect, 2, border_radius=radius)
+        return panel
+    
     def draw_simple_glow(self, surface, color, pos, radius):
         """Simple glow effect"""
         for i in range(2):
@@ -99,60 +162,84 @@ class ForestRingsGUI:
             pygame.draw.circle(glow_surface, (*color[:3], alpha), (radius, radius), radius - i * 2)
             surface.blit(glow_surface, (pos[0] - radius, pos[1] - radius), special_flags=pygame.BLEND_ADD)
     
-    def draw_tree_rings(self, surface, center_x, center_y, data_history, ring_color, current_value, unit, label, max_radius=70):
-        """Draw tree rings with separate current reading display"""
+    def get_ring_surface(self, ring_radius, alpha, thickness, ring_color):
+        """Return a cached ring surface, rendering it on first use"""
+        key = (ring_radius, alpha, thickness, ring_color)
+        ring_surface = self._ring_cache.get(key)
+        if ring_surface is None:
+            if len(self._ring_cache) >= RING_CACHE_SIZE:
+                # Evict the oldest entry
+                del self._ring_cache[next(iter(self._ring_cache))]
+            # Draw into a cleared corner of the scratch surface, the cached copy is
+            # the only allocation
+            size = ring_radius * 2 + 4
+            if self._ring_scratch is None or self._ring_scratch.get_width() < size:
+                self._ring_scratch = pygame.Surface((size, size), pygame.SRCALPHA)
+            ring_area = self._ring_scratch.subsurface((0, 0, size, size))
+            ring_area.fill((0, 0, 0, 0))
+            pygame.draw.circle(ring_area, (*ring_color[:3], alpha),
+                             (ring_radius + 2, ring_radius + 2), ring_radius, thickness)
+            ring_surface = ring_area.convert_alpha()
+            self._ring_cache[key] = ring_surface
+        return ring_surface
+    
+    def ring_layout(self, data_history, max_radius):
+        """Return (radius, alpha, thickness) for each ring oldest first, or None if all readings are equal"""
+        data_values = np.asarray(data_history, dtype=np.float64)
+        min_val = data_values.min()
+        max_val = data_values.max()
+        if max_val == min_val:
+            return None
+        
+        # Ring sizes, opacities and widths for all rings at once (newer = more opaque,
+        # thicker for the recent rings)
+        ring_count = len(data_values)
+        ages = np.arange(ring_count)
+        radii = (10 + (data_values - min_val) / (max_val - min_val) * max_radius).astype(np.int32)
+        alphas = (60 + ages / ring_count * 140).astype(np.int32)
+        thicknesses = np.where(ages < ring_count - 3, 1, 2)
+        return list(zip(radii.tolist(), alphas.tolist(), thicknesses.tolist()))
+    
+    def draw_tree_rings(self, surface, center_x, center_y, data_history, ring_color, current_value, unit, label, max_radius=70, batch=None):
+        """Draw tree rings with separate current reading display, or queue the reading blits onto batch"""
         if len(data_history) < 2:
             return
         
-        # Normalize data to ring sizes
-        data_list = list(data_history)
-        min_val = min(data_list)
-        max_val = max(data_list)
+        layout_key = (label, max_radius)
+        if layout_key not in self._ring_layouts:
+            self._ring_layouts[layout_key] = self.ring_layout(data_history, max_radius)
+        ring_layout = self._ring_layouts[layout_key]
         
-        if max_val == min_val:
+        if ring_layout is None:
             # Single value - draw a simple ring
             ring_radius = 25
             pygame.draw.circle(surface, ring_color, (center_x, center_y), ring_radius, 2)
         else:
             # Draw rings from oldest to newest (inside out)
-            for i, value in enumerate(data_list):
-                normalized = (value - min_val) / (max_val - min_val)
-                ring_radius = int(10 + normalized * max_radius)
-                
-                # Ring opacity based on age (newer = more opaque)
-                age_factor = i / len(data_list)
-                alpha = int(60 + age_factor * 140)
-                
-                # Create ring surface with alpha
-                ring_surface = pygame.Surface((ring_radius * 2 + 4, ring_radius * 2 + 4), pygame.SRCALPHA)
-                ring_color_alpha = (*ring_color[:3], alpha)
-                thickness = 1 if i < len(data_list) - 3 else 2  # Thicker for recent rings
-                pygame.draw.circle(ring_surface, ring_color_alpha, 
-                                 (ring_radius + 2, ring_radius + 2), ring_radius, thickness)
+            for ring_radius, alpha, thickness in ring_layout:
+                # Ring surface with alpha, shared by every ring of the same look
+                ring_surface = self.get_ring_surface(ring_radius, alpha, thickness, ring_color)
                 
                 # Blit ring
                 surface.blit(ring_surface, (center_x - ring_radius - 2, center_y - ring_radius - 2))
         
         # Draw current reading in a separate box below
-        reading_width, reading_height = 100, 45
+        reading_width = 100
         reading_x = center_x - reading_width // 2
         reading_y = center_y + max_radius + 25
         
-        # Reading background
-        reading_rect = pygame.Rect(reading_x, reading_y, reading_width, reading_height)
-        pygame.draw.rect(surface, COLORS['reading_bg'], reading_rect, border_radius=8)
-        pygame.draw.rect(surface, COLORS['reading_border'], reading_rect, 2, border_radius=8)
-        
-        # Label
-        label_surface = self.font_small.render(label, True, COLORS['text_dim'])
-        label_rect = label_surface.get_rect(center=(center_x, reading_y + 12))
-        surface.blit(label_surface, label_rect)
-        
         # Current value (large and clear)
         value_text = f"{current_value:.1f}{unit}"
         value_surface = self.font_medium.render(value_text, True, COLORS['text'])
         value_rect = value_surface.get_rect(center=(center_x, reading_y + 28))
-        surface.blit(value_surface, value_rect)
+        
+        # Reading box with its label, then the value - nothing else is drawn there,
+        # so a batch may be flushed after the other clusters' rings
+        reading_blits = [(self.reading_boxes[label], (reading_x, reading_y)), (value_surface, value_rect)]
+        if batch is None:
+            surface.blits(reading_blits, doreturn=False)
+        else:
+            batch.extend(reading_blits)
     
     def update_data(self, sensor_data):
         """Update sensor data history"""
@@ -160,31 +247,23 @@ class ForestRingsGUI:
             self.temp_history.append(sensor_data.get('temperature', 22.0))
             self.humidity_history.append(sensor_data.get('humidity', 65.0))
             self.pressure_history.append(sensor_data.get('pressure', 1013.0))
+            self._ring_layouts.clear()
     
     def render(self, sensor_data, gps_data, recording_status):
         self.recording = recording_status
-        self.time += 0.05
+        self._frame += 1
         
         # Update data if recording
         if self.recording and sensor_data:
             # Only update occasionally to see ring growth
-            if int(self.time * 10) % 30 == 0:  # Every 3 seconds
+            if self._frame % HISTORY_UPDATE_FRAMES == 0:
                 self.update_data(sensor_data)
         
         # Background gradient
-        for y in range(HEIGHT):
-            ratio = y / HEIGHT
-            bg_color = (
-                int(COLORS['bg'][0] + (COLORS['bg_light'][0] - COLORS['bg'][0]) * ratio),
-                int(COLORS['bg'][1] + (COLORS['bg_light'][1] - COLORS['bg'][1]) * ratio),
-                int(COLORS['bg'][2] + (COLORS['bg_light'][2] - COLORS['bg'][2]) * ratio)
-            )
-            pygame.draw.line(SCREEN, bg_color, (0, y), (WIDTH, y))
+        SCREEN.blit(self.bg_surface, (0, 0))
         
         # Title
-        title = self.font_title.render("Forest Growth Monitor", True, COLORS['accent1'])
-        title_rect = title.get_rect(center=(WIDTH // 2, 30))
-        SCREEN.blit(title, title_rect)
+        SCREEN.blit(self.title_surf, self.title_rect)
         
         # Status
         status = "GROWING" if self.recording else "PAUSED"
@@ -202,8 +281,7 @@ class ForestRingsGUI:
             pygame.draw.rect(SCREEN, COLORS['gps'], gps_rect, 2, border_radius=10)
             
             # GPS Header
-            gps_header = self.font_large.render("LOCATION", True, COLORS['gps'])
-            SCREEN.blit(gps_header, (50, gps_y + 5))
+            SCREEN.blit(self.gps_header_surf, (50, gps_y + 5))
             
             # Coordinates (large and clear)
             lat_text = f"Lat: {gps_data['latitude']:.7f}°"
@@ -222,22 +300,22 @@ class ForestRingsGUI:
         rings_y = 180
         
         # Section title
-        rings_title = self.font_large.render("Data Tree Rings", True, COLORS['text'])
-        rings_title_rect = rings_title.get_rect(center=(WIDTH // 2, rings_y - 20))
-        SCREEN.blit(rings_title, rings_title_rect)
+        SCREEN.blit(self.rings_title_surf, self.rings_title_rect)
         
         # Get current sensor values for display
         current_temp = sensor_data.get('temperature', 22.0) if sensor_data else 22.0
         current_hum = sensor_data.get('humidity', 65.0) if sensor_data else 65.0
         current_press = sensor_data.get('pressure', 1013.0) if sensor_data else 1013.0
         
-        # Draw tree rings with separate readings
+        # Draw tree rings with separate readings, all three reading boxes in one blit batch
+        reading_blits = []
         self.draw_tree_rings(SCREEN, 150, rings_y + 40, self.temp_history, COLORS['ring_temp'], 
-                           current_temp, "°C", "Temperature")
+                           current_temp, "°C", "Temperature", batch=reading_blits)
         self.draw_tree_rings(SCREEN, 400, rings_y + 40, self.humidity_history, COLORS['ring_hum'],
-                           current_hum, "%", "Humidity")
+                           current_hum, "%", "Humidity", batch=reading_blits)
         self.draw_tree_rings(SCREEN, 650, rings_y + 40, self.pressure_history, COLORS['ring_press'],
-                           current_press, " hPa", "Pressure")
+                           current_press, " hPa", "Pressure", batch=reading_blits)
+        SCREEN.blits(reading_blits, doreturn=False)
         
         # Control button
         button_text = "PAUSE" if self.recording else "START"
@@ -251,11 +329,20 @@ class ForestRingsGUI:
         SCREEN.blit(text_surface, text_rect)
         
         # Instructions
-        inst1 = self.font_small.render("Tree rings grow as sensor data changes over time", True, COLORS['text_dim'])
-        inst2 = self.font_small.render("Each ring represents a data point - newer rings are brighter", True, COLORS['text_dim'])
+        SCREEN.blit(self.inst1_surf, (50, 450))
+        SCREEN.blit(self.inst2_surf, (50, 465))
         
-        SCREEN.blit(inst1, (50, 450))
-        SCREEN.blit(inst2, (50, 465))
+        # The whole screen changed when the GPS fix or recording state did, else
+        # just the ring clusters
+        static_key = (
+            tuple(gps_data.items()) if gps_data else None,
+            self.recording,
+        )
+        if static_key != self._static_key:
+            self._static_key = static_key
+            self.dirty_rects = [SCREEN.get_rect()]
+        else:
+            self.dirty_rects = list(RING_RECTS)
         
         return button_rect
 
@@ -281,6 +368,9 @@ if __name__ == "__main__":
     
     print("Forest Rings Theme - Watch your data grow like tree rings!")
     
+    # Button hit area from the most recent render
+    button_rect = None
+    
     while running:
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
@@ -291,8 +381,7 @@ if __name__ == "__main__":
                 elif event.key == pygame.K_ESCAPE:
                     running = False
             elif event.type == pygame.MOUSEBUTTONDOWN:
-                button_rect = gui.render(sample_sensor, sample_gps, gui.recording)
-                if button_rect.collidepoint(event.pos):
+                if button_rect and button_rect.collidepoint(event.pos):
                     gui.recording = not gui.recording
         
         # Update sample data slightly for demo
@@ -302,7 +391,7 @@ if __name__ == "__main__":
             sample_sensor['pressure'] += random.uniform(-0.2, 0.2)
         
         button_rect = gui.render(sample_sensor, sample_gps, gui.recording)
-        pygame.display.flip()
+        pygame.display.update(gui.dirty_rects)
         clock.tick(30)
     
     pygame.quit()
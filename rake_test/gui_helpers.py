@@ -0,0 +1,59 @@
+"""Helpers shared by the GUI themes - no pygame setup, so any theme can import them"""
+import math
+import numpy as np
+
+class HistoryBuffer:
+    """Fixed-size NumPy ring buffer holding the most recent readings"""
+    def __init__(self, maxlen):
+        self._data = np.zeros(maxlen, dtype=np.float64)
+        self._head = 0
+        self._count = 0
+    
+    def __len__(self):
+        return self._count
+    
+    def append(self, value):
+        """Store a reading, overwriting the oldest once full"""
+        self._data[self._head] = value
+        self._head = (self._head + 1) % len(self._data)
+        self._count = min(self._count + 1, len(self._data))
+    
+    def values(self):
+        """Return the stored readings as an array, oldest first"""
+        if self._count < len(self._data):
+            return self._data[:self._count]
+        return np.concatenate((self._data[self._head:], self._data[:self._head]))
+
+# Maximum number of rendered text surfaces kept in a text cache
+TEXT_CACHE_SIZE = 256
+
+class TextCache:
+    """Rendered text surfaces keyed by (font, text, color), FIFO-bounded"""
+    def __init__(self, maxsize=TEXT_CACHE_SIZE):
+        self._surfaces = {}
+        self._maxsize = maxsize
+    
+    def render(self, font, text, color):
+        """Return a cached text surface, rendering it on first use"""
+        key = (id(font), text, color)
+        text_surface = self._surfaces.get(key)
+        if text_surface is None:
+            if len(self._surfaces) >= self._maxsize:
+                # Evict the oldest entry
+                del self._surfaces[next(iter(self._surfaces))]
+            text_surface = font.render(text, True, color).convert_alpha()
+            self._surfaces[key] = text_surface
+        return text_surface
+
+# Sine lookup table for animations (one full turn)
+SINE_TABLE_SIZE = 1024
+SINE_TABLE = [math.sin(2 * math.pi * i / SINE_TABLE_SIZE) for i in range(SINE_TABLE_SIZE)]
+SINE_TABLE_SCALE = SINE_TABLE_SIZE / (2 * math.pi)
+
+def table_sin(phase):
+    """Approximate sin(phase) from the lookup table"""
+    return SINE_TABLE[int(phase * SINE_TABLE_SCALE) & (SINE_TABLE_SIZE - 1)]
+
+def table_cos(phase):
+    """Approximate cos(phase) from the lookup table"""
+    return SINE_TABLE[(int(phase * SINE_TABLE_SCALE) + SINE_TABLE_SIZE // 4) & (SINE_TABLE_SIZE - 1)]
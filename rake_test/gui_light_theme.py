@@ -5,9 +5,10 @@ Clean white interface with subtle shadows and green accents
 """
 import os
 import pygame
-import math
+import numpy as np
 from typing import Dict, Any, List
 from collections import deque
+from gui_helpers import table_sin
 
 # Set up display - auto-detect best driver
 pygame.init()
@@ -65,12 +66,30 @@ class CleanLightGUI:
         self.recording = False
         self.history = deque(maxlen=120)
         
+        # Shadow surfaces keyed by size
+        self._shadow_cache = {}
+        
+        # Fixed text, rendered once
+        self.header_surf = self.font_large.render("Environmental Monitor", True, COLORS['text_primary']).convert_alpha()
+        self.gps_title_surf = self.font_medium.render("Location", True, COLORS['text_primary']).convert_alpha()
+        self.graph_title_surf = self.font_medium.render("Temperature History", True, COLORS['text_primary']).convert_alpha()
+        self.rec_text_surf = self.font_small.render("Recording...", True, COLORS['error']).convert_alpha()
+        self.footer_surf = self.font_tiny.render("Touch controls • Auto-logging environmental data with GPS coordinates", True, COLORS['text_secondary']).convert_alpha()
+        
+    def get_shadow_surface(self, size):
+        """Return a cached shadow surface, rendering it on first use"""
+        shadow_surf = self._shadow_cache.get(size)
+        if shadow_surf is None:
+            shadow_surf = pygame.Surface(size, pygame.SRCALPHA)
+            shadow_surf.fill((0, 0, 0, 15))
+            shadow_surf = shadow_surf.convert_alpha()
+            self._shadow_cache[size] = shadow_surf
+        return shadow_surf
+    
     def draw_shadow(self, surface, rect, offset=3):
         """Draw a subtle drop shadow"""
         shadow_rect = pygame.Rect(rect.x + offset, rect.y + offset, rect.width, rect.height)
-        shadow_surf = pygame.Surface((rect.width, rect.height), pygame.SRCALPHA)
-        shadow_surf.fill((0, 0, 0, 15))
-        surface.blit(shadow_surf, shadow_rect)
+        surface.blit(self.get_shadow_surface(rect.size), shadow_rect)
     
     def draw_card(self, surface, x, y, width, height, title, value, unit, icon="●"):
         """Draw a clean card with shadow"""
@@ -128,15 +147,17 @@ class CleanLightGUI:
         
         # Data line
         if len(data_points) > 1:
-            points = []
-            min_val = min(data_points)
-            max_val = max(data_points)
+            values = np.asarray(data_points, dtype=np.float64)
+            point_count = len(values)
+            
+            min_val = values.min()
+            max_val = values.max()
             val_range = max_val - min_val if max_val > min_val else 1
             
-            for i, val in enumerate(data_points):
-                px = x + 10 + ((i * (width - 20)) // len(data_points))
-                py = y + height - 10 - int(((val - min_val) / val_range) * (height - 20))
-                points.append((px, py))
+            # Project all readings at once
+            xs = x + 10 + np.arange(point_count) * (width - 20) // point_count
+            ys = y + height - 10 - (((values - min_val) / val_range) * (height - 20)).astype(np.int32)
+            points = list(zip(xs.tolist(), ys.tolist()))
             
             # Draw smooth line
             if len(points) > 1:
@@ -172,8 +193,7 @@ class CleanLightGUI:
         SCREEN.fill(COLORS['bg'])
         
         # Header
-        header_text = self.font_large.render("Environmental Monitor", True, COLORS['text_primary'])
-        SCREEN.blit(header_text, (30, 30))
+        SCREEN.blit(self.header_surf, (30, 30))
         
         # Status indicators
         self.draw_status_dot(SCREEN, 650, 45, sensor_data is not None, "BME680")
@@ -195,8 +215,7 @@ class CleanLightGUI:
             
             # GPS header
             pygame.draw.circle(SCREEN, COLORS['accent'], (50, 220), 8)
-            gps_title = self.font_medium.render("Location", True, COLORS['text_primary'])
-            SCREEN.blit(gps_title, (65, 213))
+            SCREEN.blit(self.gps_title_surf, (65, 213))
             
             # GPS data
             lat_text = self.font_small.render(f"Latitude: {gps_data.get('latitude', 0):.4f}°", True, COLORS['text_primary'])
@@ -213,10 +232,9 @@ class CleanLightGUI:
         
         if len(self.history) > 1:
             # Graph title
-            graph_title = self.font_medium.render("Temperature History", True, COLORS['text_primary'])
-            SCREEN.blit(graph_title, (340, 205))
+            SCREEN.blit(self.graph_title_surf, (340, 205))
             
-            self.draw_clean_graph(SCREEN, 340, 235, 430, 150, list(self.history))
+            self.draw_clean_graph(SCREEN, 340, 235, 430, 150, self.history)
         
         # Control Button
         button_text = "⏹ Stop Recording" if recording_status else "⏺ Start Recording"
@@ -225,14 +243,12 @@ class CleanLightGUI:
         # Recording indicator
         if recording_status:
             # Pulsing red dot
-            pulse = int(50 + 30 * math.sin(pygame.time.get_ticks() * 0.01))
+            pulse = int(50 + 30 * table_sin(pygame.time.get_ticks() * 0.01))
             pygame.draw.circle(SCREEN, (255, pulse, pulse), (230, 425), 8)
-            rec_text = self.font_small.render("Recording...", True, COLORS['error'])
-            SCREEN.blit(rec_text, (250, 420))
+            SCREEN.blit(self.rec_text_surf, (250, 420))
         
         # Footer
-        footer_text = self.font_tiny.render("Touch controls • Auto-logging environmental data with GPS coordinates", True, COLORS['text_secondary'])
-        SCREEN.blit(footer_text, (30, HEIGHT - 25))
+        SCREEN.blit(self.footer_surf, (30, HEIGHT - 25))
         
         return button_rect
 
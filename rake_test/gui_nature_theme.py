@@ -4,10 +4,13 @@ Nature/Earth Theme GUI - Organic Design
 Earth tones with nature-inspired colors and organic shapes
 """
 import os
+import functools
 import pygame
 import math
+import numpy as np
 from typing import Dict, Any, List
 from collections import deque
+from gui_helpers import TextCache, table_sin, table_cos
 
 # Set up display - auto-detect best driver
 pygame.init()
@@ -58,6 +61,26 @@ COLORS = {
     'water_blue': (173, 216, 230), # Light blue
 }
 
+# Growing plant sprite extent around the plant's base point
+PLANT_HALF_WIDTH = 25
+PLANT_TOP = 30
+PLANT_BOTTOM = 20
+
+# Screen areas the animated decorations can touch
+PLANT_RECT = pygame.Rect(250 - PLANT_HALF_WIDTH, 425 - PLANT_TOP, PLANT_HALF_WIDTH * 2, PLANT_TOP + PLANT_BOTTOM)
+FLOATING_LEAVES_RECT = pygame.Rect(674, 334, 52, 92)
+
+@functools.lru_cache(maxsize=None)
+def organic_shape_table(points):
+    """Per-vertex (variation, cos, sin) for an organic shape with the given point count"""
+    table = []
+    for i in range(points):
+        angle = (2 * math.pi * i) / points
+        # Add some randomness for organic feel
+        variation = 0.8 + 0.4 * math.sin(angle * 3)
+        table.append((variation, math.cos(angle), math.sin(angle)))
+    return tuple(table)
+
 class NatureGUI:
     def __init__(self):
         self.font_large = pygame.font.Font(None, 48)
@@ -68,37 +91,110 @@ class NatureGUI:
         self.recording = False
         self.history = deque(maxlen=120)
         
+        # Rendered text surfaces keyed by (font, text, color), FIFO-bounded
+        self._text_cache = TextCache()
+        
+        # Growing plant sprites keyed by their integer dimensions
+        self._plant_cache = {}
+        
+        # Wood-textured panels keyed by (color, size)
+        self._wood_cache = {}
+        
+        # Pre-rendered organic shapes keyed by (points, size, color)
+        self._shape_cache = {}
+        
+        # Background gradient never changes - build it once
+        self.bg_surface = self.build_background().convert()
+        
+        # Data-driven part of the screen, redrawn only when its inputs change
+        self.static_layer = pygame.Surface((WIDTH, HEIGHT)).convert()
+        self._static_key = None
+        self.button_rect = None
+        
+        # Screen regions changed by the last render, for display.update()
+        self.dirty_rects = []
+    
+    def build_background(self):
+        """Build the sunrise background gradient surface"""
+        # Two keyframes - smoothscale interpolates the rows in between
+        keyframes = pygame.Surface((1, 2), depth=32)  # smoothscale needs 24 or 32 bit
+        keyframes.set_at((0, 0), (245, 240, 230))
+        keyframes.set_at((0, 1), (255, 255, 250))
+        return pygame.transform.smoothscale(keyframes, (WIDTH, HEIGHT))
+        
+    def get_plant_sprite(self, growth):
+        """Return the growing plant sprite for a growth factor, rendering it on first use"""
+        # The plant only changes shape when one of its integer dimensions does
+        key = (int(10 * growth), int(5 * growth), int(8 * growth), int(6 * growth))
+        sprite = self._plant_cache.get(key)
+        if sprite is None:
+            stem_height, left_leaf_y, right_leaf_y, leaf_size = key
+            sprite = pygame.Surface((PLANT_HALF_WIDTH * 2, PLANT_TOP + PLANT_BOTTOM), pygame.SRCALPHA)
+            plant_x, plant_y = PLANT_HALF_WIDTH, PLANT_TOP
+            
+            # Stem
+            pygame.draw.line(sprite, COLORS['forest_green'], 
+                           (plant_x, plant_y + 15), (plant_x, plant_y - stem_height), 3)
+            # Leaves
+            self.draw_organic_shape(sprite, COLORS['leaf_green'], 
+                                  (plant_x - 8, plant_y - left_leaf_y), leaf_size, 4)
+            self.draw_organic_shape(sprite, COLORS['leaf_green'], 
+                                  (plant_x + 8, plant_y - right_leaf_y), leaf_size, 4)
+            sprite = sprite.convert_alpha()
+            self._plant_cache[key] = sprite
+        return sprite
+    
+    def get_organic_sprite(self, color, size, points):
+        """Return a cached organic shape sprite, rendering it on first use"""
+        key = (points, size, color)
+        sprite = self._shape_cache.get(key)
+        if sprite is None:
+            # Shapes reach at most 1.2x their size from the center
+            half = int(size * 1.2) + 2
+            sprite = pygame.Surface((half * 2, half * 2), pygame.SRCALPHA)
+            vertices = []
+            for variation, cos_a, sin_a in organic_shape_table(points):
+                radius = size * variation
+                vertices.append((half + radius * cos_a, half + radius * sin_a))
+            
+            if len(vertices) > 2:
+                pygame.draw.polygon(sprite, color, vertices)
+            sprite = sprite.convert_alpha()
+            self._shape_cache[key] = sprite
+        return sprite
+    
     def draw_organic_shape(self, surface, color, center, size, points=8):
         """Draw organic, leaf-like shapes"""
-        cx, cy = center
-        vertices = []
-        for i in range(points):
-            angle = (2 * math.pi * i) / points
-            # Add some randomness for organic feel
-            variation = 0.8 + 0.4 * math.sin(angle * 3)
-            radius = size * variation
-            x = cx + radius * math.cos(angle)
-            y = cy + radius * math.sin(angle)
-            vertices.append((x, y))
-        
-        if len(vertices) > 2:
-            pygame.draw.polygon(surface, color, vertices)
+        sprite = self.get_organic_sprite(color, size, points)
+        half = sprite.get_width() // 2
+        surface.blit(sprite, (round(center[0]) - half, round(center[1]) - half))
+    
+    def get_wood_panel(self, color, size):
+        """Return a cached wood-textured panel, rendering it on first use"""
+        key = (color, size)
+        panel = self._wood_cache.get(key)
+        if panel is None:
+            width, height = size
+            panel = pygame.Surface(size)
+            panel.fill(color)
+            
+            # Add wood grain lines
+            grain_color = (color[0] - 20, color[1] - 15, color[2] - 10)
+            sin = math.sin
+            draw_lines = pygame.draw.lines
+            xs = range(0, width, 4)
+            for y in range(0, height, 8):
+                # Wavy grain lines
+                points = [(x, y + 2 * sin(x * 0.02)) for x in xs]
+                if len(points) > 1:
+                    draw_lines(panel, grain_color, False, points, 1)
+            panel = panel.convert()
+            self._wood_cache[key] = panel
+        return panel
     
     def draw_wood_texture_rect(self, surface, color, rect):
         """Draw rectangle with wood-like texture"""
-        pygame.draw.rect(surface, color, rect)
-        
-        # Add wood grain lines
-        grain_color = (color[0] - 20, color[1] - 15, color[2] - 10)
-        for i in range(0, rect.height, 8):
-            y = rect.y + i
-            # Wavy grain lines
-            points = []
-            for x in range(rect.x, rect.x + rect.width, 4):
-                wave_y = y + 2 * math.sin((x - rect.x) * 0.02)
-                points.append((x, wave_y))
-            if len(points) > 1:
-                pygame.draw.lines(surface, grain_color, False, points, 1)
+        surface.blit(self.get_wood_panel(color, rect.size), rect)
     
     def draw_nature_card(self, surface, x, y, width, height, title, value, unit, icon_color):
         """Draw nature-themed data card"""
@@ -114,12 +210,12 @@ class NatureGUI:
         self.draw_organic_shape(surface, icon_color, (x + 25, y + 25), 12)
         
         # Title
-        title_text = self.font_small.render(title, True, COLORS['text_secondary'])
+        title_text = self._text_cache.render(self.font_small, title, COLORS['text_secondary'])
         surface.blit(title_text, (x + 45, y + 18))
         
         # Value with nature styling
-        value_text = self.font_large.render(f"{value}", True, COLORS['text_primary'])
-        unit_text = self.font_small.render(unit, True, COLORS['text_secondary'])
+        value_text = self._text_cache.render(self.font_large, f"{value}", COLORS['text_primary'])
+        unit_text = self._text_cache.render(self.font_small, unit, COLORS['text_secondary'])
         
         surface.blit(value_text, (x + 15, y + 45))
         surface.blit(unit_text, (x + 15 + value_text.get_width() + 5, y + 60))
@@ -145,7 +241,7 @@ class NatureGUI:
         self.draw_organic_shape(surface, crown_color, (x, y), 8, 6)
         
         # Label
-        label_text = self.font_small.render(label, True, COLORS['text_secondary'])
+        label_text = self._text_cache.render(self.font_small, label, COLORS['text_secondary'])
         surface.blit(label_text, (x + 20, y - 8))
     
     def draw_nature_graph(self, surface, x, y, width, height, data_points):
@@ -167,18 +263,19 @@ class NatureGUI:
         
         # Data visualization as rolling hills
         if len(data_points) > 1:
-            points = [(x, ground_y)]  # Start at ground level
+            values = np.asarray(data_points, dtype=np.float64)
+            point_count = len(values)
             
-            min_val = min(data_points)
-            max_val = max(data_points)
+            min_val = values.min()
+            max_val = values.max()
             val_range = max_val - min_val if max_val > min_val else 1
             
-            for i, val in enumerate(data_points):
-                px = x + (i * width // len(data_points))
-                py = y + height - 20 - int(((val - min_val) / val_range) * (height - 40))
-                points.append((px, py))
+            # Hill outline for all readings at once
+            xs = x + np.arange(point_count) * width // point_count
+            ys = ground_y - (((values - min_val) / val_range) * (height - 40)).astype(np.int32)
             
-            points.append((x + width, ground_y))  # End at ground level
+            # Start and end at ground level
+            points = [(x, ground_y), *zip(xs.tolist(), ys.tolist()), (x + width, ground_y)]
             
             # Fill area like hills
             if len(points) > 2:
@@ -219,7 +316,7 @@ class NatureGUI:
         
         # Button text
         text_color = COLORS['panel']
-        text_surface = self.font_medium.render(text, True, text_color)
+        text_surface = self._text_cache.render(self.font_medium, text, text_color)
         text_rect = text_surface.get_rect(center=button_rect.center)
         surface.blit(text_surface, text_rect)
         
@@ -235,104 +332,120 @@ class NatureGUI:
         
         return button_rect
     
-    def render(self, sensor_data, gps_data, recording_status):
-        """Render the complete nature-themed GUI"""
+    def draw_static_layer(self, surface, sensor_data, gps_data, recording_status):
+        """Draw everything that only changes with the data"""
         # Background gradient like sunrise
-        for y in range(HEIGHT):
-            ratio = y / HEIGHT
-            r = int(245 + 10 * ratio)
-            g = int(240 + 15 * ratio)
-            b = int(230 + 20 * ratio)
-            pygame.draw.line(SCREEN, (r, g, b), (0, y), (WIDTH, y))
+        surface.blit(self.bg_surface, (0, 0))
         
         # Header with nature styling
-        header_text = self.font_large.render("🌿 Environmental Monitor", True, COLORS['text_primary'])
-        SCREEN.blit(header_text, (30, 25))
+        header_text = self._text_cache.render(self.font_large, "🌿 Environmental Monitor", COLORS['text_primary'])
+        surface.blit(header_text, (30, 25))
         
         # Status trees
-        self.draw_tree_status(SCREEN, 650, 40, sensor_data is not None, "BME680")
-        self.draw_tree_status(SCREEN, 720, 40, gps_data is not None, "GPS")
+        self.draw_tree_status(surface, 650, 40, sensor_data is not None, "BME680")
+        self.draw_tree_status(surface, 720, 40, gps_data is not None, "GPS")
         
         # Sensor cards with nature themes
         if sensor_data:
-            self.draw_nature_card(SCREEN, 30, 90, 140, 85, "Temperature", f"{sensor_data.get('temperature', 0):.1f}", "°C", COLORS['sunset_orange'])
-            self.draw_nature_card(SCREEN, 180, 90, 140, 85, "Humidity", f"{sensor_data.get('humidity', 0):.1f}", "%", COLORS['water_blue'])
-            self.draw_nature_card(SCREEN, 330, 90, 140, 85, "Pressure", f"{sensor_data.get('pressure', 0):.0f}", "hPa", COLORS['sky_blue'])
-            self.draw_nature_card(SCREEN, 480, 90, 140, 85, "Air Quality", f"{sensor_data.get('gas', 0):.0f}", "Ω", COLORS['leaf_green'])
+            self.draw_nature_card(surface, 30, 90, 140, 85, "Temperature", f"{sensor_data.get('temperature', 0):.1f}", "°C", COLORS['sunset_orange'])
+            self.draw_nature_card(surface, 180, 90, 140, 85, "Humidity", f"{sensor_data.get('humidity', 0):.1f}", "%", COLORS['water_blue'])
+            self.draw_nature_card(surface, 330, 90, 140, 85, "Pressure", f"{sensor_data.get('pressure', 0):.0f}", "hPa", COLORS['sky_blue'])
+            self.draw_nature_card(surface, 480, 90, 140, 85, "Air Quality", f"{sensor_data.get('gas', 0):.0f}", "Ω", COLORS['leaf_green'])
         
         # GPS section styled like a compass
         if gps_data:
             compass_rect = pygame.Rect(30, 195, 280, 110)
-            self.draw_wood_texture_rect(SCREEN, COLORS['panel'], compass_rect)
-            pygame.draw.rect(SCREEN, COLORS['bark_brown'], compass_rect, 3)
+            self.draw_wood_texture_rect(surface, COLORS['panel'], compass_rect)
+            pygame.draw.rect(surface, COLORS['bark_brown'], compass_rect, 3)
             
             # Compass rose decoration
             center = (80, 250)
-            pygame.draw.circle(SCREEN, COLORS['earth_brown'], center, 25, 3)
+            pygame.draw.circle(surface, COLORS['earth_brown'], center, 25, 3)
             # Cardinal directions
-            pygame.draw.line(SCREEN, COLORS['earth_brown'], (center[0], center[1] - 20), (center[0], center[1] - 30), 2)  # N
-            pygame.draw.line(SCREEN, COLORS['earth_brown'], (center[0] + 20, center[1]), (center[0] + 30, center[1]), 2)  # E
+            pygame.draw.line(surface, COLORS['earth_brown'], (center[0], center[1] - 20), (center[0], center[1] - 30), 2)  # N
+            pygame.draw.line(surface, COLORS['earth_brown'], (center[0] + 20, center[1]), (center[0] + 30, center[1]), 2)  # E
             
             # Compass title
-            compass_title = self.font_medium.render("🧭 Location", True, COLORS['text_primary'])
-            SCREEN.blit(compass_title, (120, 210))
+            compass_title = self._text_cache.render(self.font_medium, "🧭 Location", COLORS['text_primary'])
+            surface.blit(compass_title, (120, 210))
             
             # GPS coordinates
-            lat_text = self.font_small.render(f"Latitude: {gps_data.get('latitude', 0):.4f}°", True, COLORS['text_primary'])
-            lon_text = self.font_small.render(f"Longitude: {gps_data.get('longitude', 0):.4f}°", True, COLORS['text_primary'])
-            alt_text = self.font_small.render(f"Elevation: {gps_data.get('altitude', 0):.1f} m", True, COLORS['text_primary'])
+            lat_text = self._text_cache.render(self.font_small, f"Latitude: {gps_data.get('latitude', 0):.4f}°", COLORS['text_primary'])
+            lon_text = self._text_cache.render(self.font_small, f"Longitude: {gps_data.get('longitude', 0):.4f}°", COLORS['text_primary'])
+            alt_text = self._text_cache.render(self.font_small, f"Elevation: {gps_data.get('altitude', 0):.1f} m", COLORS['text_primary'])
             
-            SCREEN.blit(lat_text, (120, 235))
-            SCREEN.blit(lon_text, (120, 255))
-            SCREEN.blit(alt_text, (120, 275))
+            surface.blit(lat_text, (120, 235))
+            surface.blit(lon_text, (120, 255))
+            surface.blit(alt_text, (120, 275))
         
         # Nature graph
-        if sensor_data and 'temperature' in sensor_data:
-            self.history.append(sensor_data['temperature'])
-        
         if len(self.history) > 1:
             # Graph title
-            graph_title = self.font_medium.render("🌡️ Temperature Landscape", True, COLORS['text_primary'])
-            SCREEN.blit(graph_title, (330, 200))
+            graph_title = self._text_cache.render(self.font_medium, "🌡️ Temperature Landscape", COLORS['text_primary'])
+            surface.blit(graph_title, (330, 200))
             
-            self.draw_nature_graph(SCREEN, 330, 230, 440, 140, list(self.history))
+            self.draw_nature_graph(surface, 330, 230, 440, 140, self.history)
         
         # Wooden control button
         button_text = "🛑 Stop Recording" if recording_status else "🌱 Start Recording"
-        button_rect = self.draw_wooden_button(SCREEN, 30, 400, 200, 50, button_text, recording_status)
+        button_rect = self.draw_wooden_button(surface, 30, 400, 200, 50, button_text, recording_status)
+        
+        # Recording status text
+        if recording_status:
+            rec_text = self._text_cache.render(self.font_small, "Growing data...", COLORS['forest_green'])
+            surface.blit(rec_text, (270, 415))
+        
+        # Footer with nature elements
+        footer_text = self._text_cache.render(self.font_tiny, "🌍 Monitoring our environment • Preserving nature's data", COLORS['text_secondary'])
+        surface.blit(footer_text, (30, HEIGHT - 25))
+        
+        return button_rect
+    
+    def render(self, sensor_data, gps_data, recording_status):
+        """Render the complete nature-themed GUI"""
+        # Temperature history for the nature graph
+        if sensor_data and 'temperature' in sensor_data:
+            self.history.append(sensor_data['temperature'])
+        
+        # Static layer - only redrawn when something it shows has changed
+        static_key = (
+            tuple(sensor_data.items()) if sensor_data is not None else None,
+            tuple(gps_data.items()) if gps_data is not None else None,
+            recording_status,
+            tuple(self.history),
+        )
+        if static_key != self._static_key:
+            self.button_rect = self.draw_static_layer(self.static_layer, sensor_data, gps_data, recording_status)
+            self._static_key = static_key
+            self.dirty_rects = [SCREEN.get_rect()]
+        else:
+            # Only the animated decorations need presenting
+            self.dirty_rects = [FLOATING_LEAVES_RECT]
+            if recording_status:
+                self.dirty_rects.append(PLANT_RECT)
+        for rect in self.dirty_rects:
+            SCREEN.blit(self.static_layer, rect, rect)
         
         # Recording indicator like growing plant
         if recording_status:
             # Animated growing plant
-            growth = 1.0 + 0.3 * math.sin(pygame.time.get_ticks() * 0.005)
+            growth = 1.0 + 0.3 * table_sin(pygame.time.get_ticks() * 0.005)
             plant_x, plant_y = 250, 425
-            
-            # Stem
-            pygame.draw.line(SCREEN, COLORS['forest_green'], 
-                           (plant_x, plant_y + 15), (plant_x, plant_y - int(10 * growth)), 3)
-            # Leaves
-            leaf_size = int(6 * growth)
-            self.draw_organic_shape(SCREEN, COLORS['leaf_green'], 
-                                  (plant_x - 8, plant_y - int(5 * growth)), leaf_size, 4)
-            self.draw_organic_shape(SCREEN, COLORS['leaf_green'], 
-                                  (plant_x + 8, plant_y - int(8 * growth)), leaf_size, 4)
-            
-            # Status text
-            rec_text = self.font_small.render("Growing data...", True, COLORS['forest_green'])
-            SCREEN.blit(rec_text, (270, 415))
-        
-        # Footer with nature elements
-        footer_text = self.font_tiny.render("🌍 Monitoring our environment • Preserving nature's data", True, COLORS['text_secondary'])
-        SCREEN.blit(footer_text, (30, HEIGHT - 25))
+            plant_sprite = self.get_plant_sprite(growth)
+            SCREEN.blit(plant_sprite, (plant_x - PLANT_HALF_WIDTH, plant_y - PLANT_TOP))
         
         # Small decorative elements
         # Butterflies or leaves floating
+        ticks = pygame.time.get_ticks()
+        sin, cos = table_sin, table_cos
+        draw_shape = self.draw_organic_shape
+        leaf_color = COLORS['leaf_green']
         for i in range(3):
-            x = 700 + 20 * math.sin(pygame.time.get_ticks() * 0.002 + i)
-            y = 350 + i * 30 + 10 * math.cos(pygame.time.get_ticks() * 0.003 + i)
-            self.draw_organic_shape(SCREEN, COLORS['leaf_green'], (x, y), 4, 4)
+            x = 700 + 20 * sin(ticks * 0.002 + i)
+            y = 350 + i * 30 + 10 * cos(ticks * 0.003 + i)
+            draw_shape(SCREEN, leaf_color, (x, y), 4, 4)
         
-        return button_rect
+        return self.button_rect
 
 # Test the nature theme
 if __name__ == "__main__":
@@ -353,7 +466,7 @@ if __name__ == "__main__":
                     running = False
         
         button_rect = gui.render(sample_sensor, sample_gps, gui.recording)
-        pygame.display.flip()
+        pygame.display.update(gui.dirty_rects)
         clock.tick(30)
     
     pygame.quit()